@@ -1,11 +1,20 @@
 #!/usr/bin/env python
 import requests
 import time
+import json
 import logging
 import os
 
 logger = logging.getLogger(__name__)
 
+# Decode JSON with orjson when it is installed, it is much faster on a Pi.
+# Shared by everything that parses API responses.
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 class APIService:
     """Service for handling API requests with caching"""
 
@@ -16,6 +25,7 @@ class APIService:
             config_manager: ConfigManager instance
         """
         self.config = config_manager
+        self.session = requests.Session()  # keep-alive connections across requests
         self.cache = {}
         self.cache_expiry = {}
 
@@ -43,11 +53,11 @@ class APIService:
         # Make request
         try:
             logger.info(f"Making API request to {url}")
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
 
             if response.status_code == 200:
                 try:
-                    data = response.json()
+                    data = json_loads(response.content)
 
                     # Cache result
                     self.cache[cache_key] = data
@@ -225,7 +225,8 @@ class DisplayManager:
             self.config.set("current_state", "current_plugin", plugin_name)
 
             # Force immediate render of the new content
-            self.canvas.Clear()
+            if not self.current_plugin.draws_full_frame:
+                self.canvas.Clear()
             self.current_plugin.render(self.canvas)
             self.canvas = self.matrix.SwapOnVSync(self.canvas)
 
@@ -305,14 +306,17 @@ class DisplayManager:
                 # Update plugin state
                 self.current_plugin.update(delta_time)
 
-                # Clear canvas
-                self.canvas.Clear()
+                # Keep showing the last frame if nothing changed
+                if self.current_plugin.needs_render():
+                    # Clear canvas, unless the plugin overwrites all of it
+                    if not self.current_plugin.draws_full_frame:
+                        self.canvas.Clear()
 
-                # Render plugin
-                self.current_plugin.render(self.canvas)
+                    # Render plugin
+                    self.current_plugin.render(self.canvas)
 
-                # Swap canvas
-                self.canvas = self.matrix.SwapOnVSync(self.canvas)
+                    # Swap canvas
+                    self.canvas = self.matrix.SwapOnVSync(self.canvas)
 
                 # Sleep to maintain reasonable framerate
                 time.sleep(0.01)
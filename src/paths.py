@@ -14,6 +14,9 @@ SYSTEM_PATHS = {
     'tmp_dir': tempfile.gettempdir(),
 }
 
+# Cache directory for rendered images and API responses
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'rpi-led-matrix')
+
 # Font paths (in order of preference)
 FONT_SEARCH_PATHS = [
     "/usr/share/fonts/truetype/dejavu/DejaVuSansMono-Bold.ttf",
@@ -91,6 +94,20 @@ def get_temp_file_path(filename):
     """
     return os.path.join(get_system_path('tmp_dir', '/tmp'), filename)
 
+def get_cache_dir(name):
+    """
+    Get a cache subdirectory, creating it if needed.
+
+    Args:
+        name: Name of the cache subdirectory
+
+    Returns:
+        Full path to the cache directory
+    """
+    path = os.path.join(CACHE_DIR, name)
+    os.makedirs(path, exist_ok=True)
+    return path
+
 def validate_system_paths():
     """
     Validate that critical system paths exist.
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""
+Small on-disk JSON cache shared by plugins that call web APIs
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+
+from paths import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+class FileCache:
+    """JSON file cache with a per-lookup time-to-live
+
+    Each entry is stored as {"ts": epoch, "data": value} in its own file under
+    the rpi-led-matrix cache directory, so cached API responses survive
+    restarts. Files are written atomically, so entries can be set from
+    several threads as long as they use different keys.
+    """
+
+    def __init__(self, name):
+        """Initialize the cache
+
+        Args:
+            name: Name of the cache subdirectory
+        """
+        self.name = name
+        self._directory = None
+
+    def _path(self, key):
+        """Get the file path for a key, or None if the cache is unavailable"""
+        if self._directory is None:
+            try:
+                self._directory = get_cache_dir(self.name)
+            except OSError as e:
+                logger.warning("%s cache disabled: %s", self.name, e)
+                self._directory = ''
+
+        if not self._directory:
+            return None
+
+        digest = hashlib.md5(key.encode()).hexdigest()
+        return os.path.join(self._directory, f"{digest}.json")
+
+    def get_entry(self, key):
+        """Get a cached value regardless of its age
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (value, epoch time it was stored), or (None, 0) if the
+            entry is missing or unreadable
+        """
+        path = self._path(key)
+        if not path:
+            return None, 0
+
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None, 0
+
+        return entry.get('data'), entry.get('ts', 0)
+
+    def get(self, key, ttl):
+        """Get a cached value
+
+        Args:
+            key: Cache key
+            ttl: Maximum age of the entry in seconds
+
+        Returns:
+            The cached value, or None if missing, expired or unreadable
+        """
+        value, ts = self.get_entry(key)
+        if time.time() - ts >= ttl:
+            return None
+        return value
+
+    def set(self, key, value):
+        """Store a JSON-serializable value
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        path = self._path(key)
+        if not path:
+            return
+
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump({'ts': time.time(), 'data': value}, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Error writing %s cache entry: %s", self.name, e)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
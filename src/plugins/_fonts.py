@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+"""
+BDF fonts shared by all plugins
+
+Parsing a BDF font is slow on the Pi, and most plugins use the same few
+fonts, so each font file is loaded once per process and reused.
+"""
+
+from rgbmatrix import graphics
+
+_fonts = {}
+
+def load_font(path):
+    """Load a BDF font, reusing it if it was loaded before
+
+    Args:
+        path: Path to the BDF font file
+
+    Returns:
+        graphics.Font instance
+
+    Raises:
+        Whatever LoadFont raises if the font can't be loaded; failures
+        are not cached, so the next call tries again
+    """
+    font = _fonts.get(path)
+    if font is None:
+        font = graphics.Font()
+        font.LoadFont(path)
+        _fonts[path] = font
+    return font
@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+"""
+Process-wide API services shared by the plugins
+
+Plugins used to build their own APIService on setup, so each one kept a
+separate response cache and HTTP connection pool. Sharing one instance lets
+the clock, weather and prayer plugins reuse each other's cached responses.
+"""
+
+from api_service import APIService, WeatherService, PrayerTimesService
+
+_api_service = None
+_weather_service = None
+_prayer_service = None
+
+def get_api_service():
+    """Get the shared APIService, creating it on first use"""
+    global _api_service
+    if _api_service is None:
+        _api_service = APIService(None)  # We'll need to pass config
+    return _api_service
+
+def get_weather_service():
+    """Get the shared WeatherService, creating it on first use"""
+    global _weather_service
+    if _weather_service is None:
+        _weather_service = WeatherService(get_api_service())
+    return _weather_service
+
+def get_prayer_service():
+    """Get the shared PrayerTimesService, creating it on first use"""
+    global _prayer_service
+    if _prayer_service is None:
+        _prayer_service = PrayerTimesService(get_api_service())
+    return _prayer_service
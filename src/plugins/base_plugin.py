@@ -22,6 +22,10 @@ class DisplayPlugin(ABC):
         self.description = "Base display plugin"
         self.running = False
 
+        # Set by plugins whose render() always paints (or clears) the whole
+        # canvas, so the display loop doesn't need to clear it first
+        self.draws_full_frame = False
+
     def setup(self):
         """Initialize the plugin
 
@@ -48,6 +52,19 @@ class DisplayPlugin(ABC):
         """
         pass
 
+    def needs_render(self):
+        """Check whether the display is out of date
+
+        The display loop skips clearing, rendering and swapping the canvas
+        while this returns False, leaving the last frame on the matrix.
+        Plugins that draw a static image can override it to avoid pushing
+        the same frame to the matrix over and over.
+
+        Returns:
+            True if render() should be called for the next frame
+        """
+        return True
+
     def cleanup(self):
         """Clean up resources
 
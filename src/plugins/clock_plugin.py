@@ -4,9 +4,26 @@ from PIL import Image, ImageDraw
 from rgbmatrix import graphics
 
 from .base_plugin import DisplayPlugin
-from ui.text import TextComponent
+from ._fonts import load_font
+from ui.text import TextComponent, load_glyph_images, draw_glyph_text
 from ui.layout import GridLayout
-from api_service import WeatherService, PrayerTimesService
+from ._services import get_weather_service, get_prayer_service
+
+FONT_PATHS = {
+    'font': "resources/fonts/7x13.bdf",
+    'font_small': "resources/fonts/4x6.bdf"
+}
+
+# Characters pre-rendered per (font, color) pair for the frequently drawn text
+DIGITS = '0123456789'
+DAY_CHARS = 'MonTueWedThuFriSatSun'
+MONTH_CHARS = 'JanFebMarAprMayJunJulAugSepOctNovDec'
+GLYPH_SETS = (
+    ('font', (255, 255, 255), DIGITS + ':AMP '),
+    ('font', (0, 191, 255), DIGITS + '-° '),
+    ('font_small', (173, 255, 47), DIGITS + DAY_CHARS),
+    ('font_small', (255, 255, 0), MONTH_CHARS)
+)
 
 class ClockPlugin(DisplayPlugin):
     """Plugin for displaying clock, date, weather, and prayer time
@@ -19,6 +36,9 @@ class ClockPlugin(DisplayPlugin):
         units (str): 'metric' or 'imperial'
     """
 
+    # Hot-path configuration values copied from self.config in setup()
+    __slots__ = ('_update_interval', '_time_fmt')
+
     def __init__(self, matrix, config=None):
         super().__init__(matrix, config)
         self.name = "clock"
@@ -30,6 +50,7 @@ class ClockPlugin(DisplayPlugin):
         self.config.setdefault('update_interval', 3600)
         self.config.setdefault('city_id', 4791160)
         self.config.setdefault('units', 'imperial')
+        self._apply_config()
 
         # Internal state
         self.last_weather_update = 0
@@ -37,6 +58,7 @@ class ClockPlugin(DisplayPlugin):
         self.weather_data = None
         self.prayer_data = None
         self.weather_image = None
+        self._glyph_cache = {}
 
         # Font loading
         self.font = graphics.Font()
@@ -68,24 +90,67 @@ class ClockPlugin(DisplayPlugin):
 
     def setup(self):
         """Set up the clock plugin"""
+        self._apply_config()
+
         # Load fonts
         try:
-            self.font_small.LoadFont("resources/fonts/4x6.bdf")
-            self.font.LoadFont("resources/fonts/7x13.bdf") 
+            self.font_small = load_font(FONT_PATHS['font_small'])
+            self.font = load_font(FONT_PATHS['font'])
         except Exception as e:
             print(f"Error loading fonts: {e}")
 
-        # Initialize services if not already
+        # Pre-render glyphs for the text drawn every frame
+        self._build_glyph_cache()
+
+        # Use the shared services if they weren't provided
         if self.weather_service is None:
-            from api_service import APIService
-            api_service = APIService(None)  # We'll need to pass config
-            self.weather_service = WeatherService(api_service)
-            self.prayer_service = PrayerTimesService(api_service)
+            self.weather_service = get_weather_service()
+            self.prayer_service = get_prayer_service()
 
         # Initial data fetch
         self._update_weather()
         self._update_prayer_times()
 
+    def _apply_config(self):
+        """Copy configuration values used every frame into slot attributes"""
+        self._update_interval = self.config['update_interval']
+
+        if self.config['format_24h']:
+            time_format = '%H:%M'
+            if self.config['show_seconds']:
+                time_format += ':%S'
+        else:
+            time_format = '%I:%M'
+            if self.config['show_seconds']:
+                time_format += ':%S'
+            time_format += '%p'
+        self._time_fmt = time_format
+
+    def _build_glyph_cache(self):
+        """Rasterize the characters used by the clock text into images"""
+        self._glyph_cache = {}
+        for font_id, color_rgb, chars in GLYPH_SETS:
+            try:
+                glyphs = load_glyph_images(FONT_PATHS[font_id], color_rgb, chars)
+            except Exception as e:
+                print(f"Error rendering glyphs for {font_id}: {e}")
+                continue
+
+            for char, glyph in glyphs.items():
+                self._glyph_cache[(font_id, color_rgb, char)] = glyph
+
+    def _draw_text(self, canvas, font_id, color_rgb, x, y, text):
+        """Draw text from cached glyphs, falling back to DrawText"""
+        glyphs = {}
+        for char in text:
+            glyph = self._glyph_cache.get((font_id, color_rgb, char))
+            if glyph is None:
+                return graphics.DrawText(canvas, getattr(self, font_id), x, y,
+                                         graphics.Color(*color_rgb), text)
+            glyphs[char] = glyph
+
+        return draw_glyph_text(canvas, glyphs, x, y, text)
+
     def _update_weather(self):
         """Update weather data from API"""
         if self.weather_service:
@@ -163,7 +228,7 @@ class ClockPlugin(DisplayPlugin):
         self.last_prayer_update += delta_time
 
         # Check if weather update is needed
-        if self.last_weather_update >= self.config['update_interval']:
+        if self.last_weather_update >= self._update_interval:
             self._update_weather()
 
         # Check if prayer update is needed (every 4 hours)
@@ -186,35 +251,21 @@ class ClockPlugin(DisplayPlugin):
         date = now.strftime('%d')
         month = now.strftime('%b')
 
-        if self.config['format_24h']:
-            time_format = '%H:%M'
-            if self.config['show_seconds']:
-                time_format += ':%S'
-        else:
-            time_format = '%I:%M'
-            if self.config['show_seconds']:
-                time_format += ':%S'
-            time_format += '%p'
-
-        time_str = now.strftime(time_format)
+        time_str = now.strftime(self._time_fmt)
 
         # Draw calendar (day, date, month)
-        graphics.DrawText(canvas, self.font_small, 3, 6, 
-                          self.colors['lime'], day)
-        graphics.DrawText(canvas, self.font_small, 20, 6, 
-                          self.colors['lime'], date)
-        graphics.DrawText(canvas, self.font_small, 30, 6, 
-                          self.colors['yellow'], month)
+        self._draw_text(canvas, 'font_small', (173, 255, 47), 3, 6, day)
+        self._draw_text(canvas, 'font_small', (173, 255, 47), 20, 6, date)
+        self._draw_text(canvas, 'font_small', (255, 255, 0), 30, 6, month)
 
         # Draw time
-        graphics.DrawText(canvas, self.font, 3, 18, 
-                          self.colors['white'], time_str)
+        self._draw_text(canvas, 'font', (255, 255, 255), 3, 18, time_str)
 
         # Draw weather info if available
         if self.weather_data:
             # Display temperature
-            graphics.DrawText(canvas, self.font, 42, 30, 
-                              self.colors['skyBlue'], self.weather_data['temp'])
+            self._draw_text(canvas, 'font', (0, 191, 255), 42, 30,
+                            self.weather_data['temp'])
 
             # Display high/low
             graphics.DrawText(canvas, self.font_small, 28, 25, 
@@ -5,6 +5,7 @@ from PIL import Image
 from rgbmatrix import graphics
 
 from .base_plugin import DisplayPlugin
+from ._fonts import load_font
 from ui.image import AnimatedImageComponent
 
 class GifPlugin(DisplayPlugin):
@@ -16,6 +17,9 @@ class GifPlugin(DisplayPlugin):
         show_clock (bool): Whether to show a clock overlay on the GIF
     """
 
+    # Hot-path configuration values copied from self.config in setup()
+    __slots__ = ('_show_clock', '_time_fmt')
+
     def __init__(self, matrix, config=None):
         super().__init__(matrix, config)
         self.name = "gif"
@@ -25,6 +29,7 @@ class GifPlugin(DisplayPlugin):
         self.config.setdefault('directory', 'resources/images/gifs')
         self.config.setdefault('current_gif', 'matrix')
         self.config.setdefault('show_clock', True)
+        self._apply_config()
 
         # Font loading
         self.font = graphics.Font()
@@ -46,9 +51,11 @@ class GifPlugin(DisplayPlugin):
 
     def setup(self):
         """Set up the GIF plugin"""
+        self._apply_config()
+
         # Load font
         try:
-            self.font.LoadFont("resources/fonts/7x13.bdf")
+            self.font = load_font("resources/fonts/7x13.bdf")
         except Exception as e:
             import logging
             logging.getLogger(__name__).error(f"Error loading font: {e}")
@@ -59,6 +66,11 @@ class GifPlugin(DisplayPlugin):
         # Reset error reporting flag
         self.reported_error = False
 
+    def _apply_config(self):
+        """Copy configuration values used every frame into slot attributes"""
+        self._show_clock = self.config.get('show_clock', True)
+        self._time_fmt = "%H:%M" if self.config.get('format_24h', True) else "%I:%M%p"
+
     def reload_if_changed(self):
         """Check if the GIF has changed and reload if necessary"""
         current_gif = self.config.get('current_gif', 'matrix')
@@ -147,15 +159,9 @@ class GifPlugin(DisplayPlugin):
                 return
 
         # Overlay clock if enabled
-        if self.config.get('show_clock', True):
+        if self._show_clock:
             import datetime
-            now = datetime.datetime.now()
-
-            # Format time string
-            if self.config.get('format_24h', True):
-                time_str = now.strftime("%H:%M")
-            else:
-                time_str = now.strftime("%I:%M%p").lower()
+            time_str = datetime.datetime.now().strftime(self._time_fmt).lower()
 
             # Measure approximate width to center
             text_width = len(time_str) * 7  # Approximate width per character
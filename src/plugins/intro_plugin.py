@@ -5,6 +5,7 @@ from PIL import Image
 from rgbmatrix import graphics
 
 from .base_plugin import DisplayPlugin
+from ._fonts import load_font
 from ui.image import load_image
 
 class IntroPlugin(DisplayPlugin):
@@ -57,11 +58,10 @@ class IntroPlugin(DisplayPlugin):
             canvas.SetImage(self.logo_image, max(0, x), max(0, y))
         else:
             # Fallback - draw text
-            font = graphics.Font()
             try:
-                font.LoadFont("resources/fonts/7x13.bdf")
+                font = load_font("resources/fonts/7x13.bdf")
             except Exception as e:
-                pass  # Use default font if loading fails
+                font = graphics.Font()  # Use default font if loading fails
 
             text = "InfoCube"
             color = graphics.Color(0, 191, 255)  # Sky blue
@@ -5,6 +5,7 @@ from PIL import Image, ImageDraw
 from rgbmatrix import graphics
 
 from .base_plugin import DisplayPlugin
+from ._fonts import load_font
 
 class MoonPlugin(DisplayPlugin):
     """Plugin for displaying the current phase of the moon
@@ -46,8 +47,8 @@ class MoonPlugin(DisplayPlugin):
         """Set up the moon phase plugin"""
         # Load fonts
         try:
-            self.font_small.LoadFont("resources/fonts/4x6.bdf")
-            self.font.LoadFont("resources/fonts/7x13.bdf") 
+            self.font_small = load_font("resources/fonts/4x6.bdf")
+            self.font = load_font("resources/fonts/7x13.bdf")
         except Exception as e:
             print(f"Error loading fonts: {e}")
 
@@ -1,12 +1,16 @@
 #!/usr/bin/env python
-from datetime import datetime
+from datetime import datetime, timedelta
+import time
 from PIL import Image
 import os
-from rgbmatrix import graphics
 
 from .base_plugin import DisplayPlugin
-from api_service import PrayerTimesService
+from ._services import get_prayer_service
 from ui.image import load_image
+from ui.text import load_glyph_images, paste_glyph_text
+
+# Project root, image paths in the config are relative to it
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
 
 class PrayerPlugin(DisplayPlugin):
     """Plugin for displaying prayer times
@@ -23,6 +27,7 @@ class PrayerPlugin(DisplayPlugin):
         super().__init__(matrix, config)
         self.name = "prayer"
         self.description = "Prayer times display"
+        self.draws_full_frame = True  # blits full-frame images or clears
 
         # Default configuration
         self.config.setdefault('latitude', 38.903481)
@@ -39,48 +44,64 @@ class PrayerPlugin(DisplayPlugin):
         self.update_interval = 14400  # 4 hours
         self.prayer_times = None
         self.next_prayer = None
+        self._next_prayer_ts = None  # epoch time of the next prayer
         self.mosque_image = None
         self.force_update = False
 
-        # Font loading
-        self.font = graphics.Font()
-        self.font_small = graphics.Font()
-
-        # Colors
-        self.colors = {
-            'white': graphics.Color(255, 255, 255),
-            'skyBlue': graphics.Color(0, 191, 255),
-            'orange': graphics.Color(255, 165, 0),
-            'error': graphics.Color(255, 0, 0)
-        }
+        # Pre-rendered display, rebuilt when the prayer data changes
+        self._overlay = None
+        self._shown_overlay = None  # overlay last pushed to the matrix
 
         # API service
         self.prayer_service = None
 
     def setup(self):
         """Set up the prayer plugin"""
-        # Load fonts
-        try:
-            self.font_small.LoadFont("resources/fonts/4x6.bdf")
-            self.font.LoadFont("resources/fonts/7x13.bdf") 
-        except Exception as e:
-            print(f"Error loading fonts: {e}")
-
         # Load mosque image if enabled
         if self.config['show_mosque_image']:
-            project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
-            mosque_path = os.path.join(project_root, self.config['mosque_image_path'])
+            mosque_path = os.path.join(_PROJECT_ROOT, self.config['mosque_image_path'])
             self.mosque_image = load_image(mosque_path)
 
-        # Initialize service if not already
+        # Use the shared service if one wasn't provided
         if self.prayer_service is None:
-            from api_service import APIService
-            api_service = APIService(None)  # We'll need to pass config
-            self.prayer_service = PrayerTimesService(api_service)
+            self.prayer_service = get_prayer_service()
 
         # Initial data fetch
         self._update_prayer_times()
 
+    def _build_overlay(self):
+        """Render the whole display into an image
+
+        Called whenever the prayer times or the next prayer change, so that
+        render() only has to blit the result.
+        """
+        image = Image.new('RGB', (self.matrix.width, self.matrix.height), (0, 0, 0))
+        font_path = "resources/fonts/4x6.bdf"
+
+        # Display mosque image if available
+        if self.mosque_image and self.config['show_mosque_image']:
+            image.paste(self.mosque_image, (44, 2))
+
+        if self.prayer_times:
+            names = load_glyph_images(font_path, (0, 191, 255), ''.join(self.prayer_names))
+            times = load_glyph_images(font_path, (255, 255, 255), '0123456789:')
+            next_times = load_glyph_images(font_path, (255, 165, 0), '0123456789:')
+
+            for i, name in enumerate(self.prayer_names):
+                # Highlight the next prayer
+                glyphs = next_times if self.next_prayer and i == self.next_prayer['index'] else times
+
+                paste_glyph_text(image, names, 5, (i+1)*6, name)
+                paste_glyph_text(image, glyphs, 23, (i+1)*6, self.prayer_times[i])
+        else:
+            # Display error message if API failed
+            paste_glyph_text(image, load_glyph_images(font_path, (255, 0, 0), "Prayer API Error"),
+                             5, 15, "Prayer API Error")
+            paste_glyph_text(image, load_glyph_images(font_path, (255, 255, 255), "Retrying..."),
+                             5, 25, "Retrying...")
+
+        self._overlay = image
+
     def _update_prayer_times(self):
         """Update prayer times from API"""
         if self.prayer_service:
@@ -100,8 +121,11 @@ class PrayerPlugin(DisplayPlugin):
                     timings['Isha']
                 ]
 
-                # Calculate next prayer
+                # Calculate next prayer (also rebuilds the overlay)
                 self._calculate_next_prayer()
+            elif self._overlay is None:
+                # Show the error screen until the API responds
+                self._safe_build_overlay()
 
             self.last_update = 0
             self.force_update = False
@@ -110,67 +134,70 @@ class PrayerPlugin(DisplayPlugin):
         """Calculate the next prayer time"""
         if not self.prayer_times:
             self.next_prayer = None
+            self._next_prayer_ts = None
             return
 
-        # Get current time in HH:MM format
-        current_time = datetime.now().strftime('%H:%M')
+        # Parse the HH:MM strings into minutes since midnight
+        prayer_minutes = [int(t[:2])*60 + int(t[3:5]) for t in self.prayer_times]
 
-        # Find the next prayer time
-        for i, prayer_time in enumerate(self.prayer_times):
-            if prayer_time > current_time:
-                self.next_prayer = {
-                    'index': i,
-                    'name': self.prayer_names[i],
-                    'time': prayer_time
-                }
-                return
+        # Get current time as minutes since midnight
+        now = datetime.now()
+        now_minutes = now.hour*60 + now.minute
 
-        # If all prayers have passed, the next prayer is Fajr tomorrow
+        # Find the next prayer time. If all prayers have passed, the next
+        # prayer is Fajr tomorrow
+        index = next((i for i, minutes in enumerate(prayer_minutes)
+                      if minutes > now_minutes), None)
+        next_day = index is None
+        if next_day:
+            index = 0
         self.next_prayer = {
-            'index': 0,
-            'name': self.prayer_names[0],
-            'time': self.prayer_times[0]
+            'index': index,
+            'name': self.prayer_names[index],
+            'time': self.prayer_times[index]
         }
 
+        # Remember when it starts so update() only compares two numbers
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        if next_day:
+            midnight += timedelta(days=1)
+        self._next_prayer_ts = (midnight + timedelta(minutes=prayer_minutes[index])).timestamp()
+
+        # The highlighted time changed, redraw the display
+        self._safe_build_overlay()
+
     def update(self, delta_time):
         """Update prayer times display"""
         # Update timers
         self.last_update += delta_time
 
-        # Get current time
-        current_time = datetime.now().strftime('%H:%M')
-
         # Check if next prayer time has passed
-        if self.next_prayer and current_time >= self.next_prayer['time']:
+        if self._next_prayer_ts and time.time() >= self._next_prayer_ts:
             self.force_update = True
 
         # Update if forced or interval elapsed
         if self.force_update or self.last_update >= self.update_interval:
             self._update_prayer_times()
 
-    def render(self, canvas):
-        """Render the prayer times display"""
-        # Clear canvas
-        canvas.Clear()
-
-        # Display mosque image if available
-        if self.mosque_image and self.config['show_mosque_image']:
-            canvas.SetImage(self.mosque_image, 44, 2)
+    def _safe_build_overlay(self):
+        """Rebuild the overlay, leaving the previous one in place on error"""
+        try:
+            self._build_overlay()
+        except Exception as e:
+            print(f"Error rendering prayer display: {e}")
 
-        if self.prayer_times:
-            # Display prayer times
-            for i in range(5):
-                # Highlight the next prayer
-                time_color = self.colors['orange'] if self.next_prayer and i == self.next_prayer['index'] else self.colors['white']
+    def needs_render(self):
+        """Only redraw once the overlay has been rebuilt"""
+        return self._overlay is None or self._overlay is not self._shown_overlay
 
-                graphics.DrawText(canvas, self.font_small, 5, (i+1)*6, 
-                                 self.colors['skyBlue'], self.prayer_names[i])
+    def render(self, canvas):
+        """Render the prayer times display"""
+        if self._overlay is None:
+            self._safe_build_overlay()
 
-                graphics.DrawText(canvas, self.font_small, 23, (i+1)*6, 
-                                 time_color, self.prayer_times[i])
+        # The overlay covers the whole display, so this also clears the canvas
+        if self._overlay:
+            canvas.SetImage(self._overlay, 0, 0)
         else:
-            # Display error message if API failed
-            graphics.DrawText(canvas, self.font_small, 5, 15, 
-                             self.colors['error'], "Prayer API Error")
-            graphics.DrawText(canvas, self.font_small, 5, 25, 
-                             self.colors['white'], "Retrying...")
\ No newline at end of file
+            canvas.Clear()
+        self._shown_overlay = self._overlay
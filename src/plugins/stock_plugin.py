@@ -5,17 +5,174 @@ Enhanced stock plugin for 32x64 LED matrix display with area highlighting under
 
 import time
 import os
-import json
+import types
+import functools
+import hashlib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from PIL import Image, ImageDraw
 from rgbmatrix import graphics
 
 from .base_plugin import DisplayPlugin
+from ._fonts import load_font
+from ._cache import FileCache
+from paths import get_cache_dir
+from api_service import json_loads
+from ui.text import load_glyph_images, paste_glyph_text
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Time zone of the US stock markets, falls back to local time if unavailable
+try:
+    from zoneinfo import ZoneInfo
+    _MARKET_TZ = ZoneInfo('America/New_York')
+except Exception:
+    _MARKET_TZ = None
+
+# Project root and the main configuration file
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+_CONFIG_PATH = os.path.join(_PROJECT_ROOT, 'config.json')
+
+# Seconds before config.json is read again when it had no Finnhub API key
+API_KEY_RECHECK_INTERVAL = 300
+
+# Most quote requests in flight at once (and kept-alive connections)
+MAX_FETCH_WORKERS = 8
+
+# Longest wait (seconds) before retrying a symbol that keeps failing
+MAX_RETRY_BACKOFF = 3600
+
+# Number of points in the synthetic intraday price curve
+CURVE_POINTS = 40
+
+# Version of the stock image drawing, part of the image cache key; bump it
+# whenever the drawing changes so stale cached images aren't shown
+IMAGE_RENDER_VERSION = 1
+
+# Interior curve positions (0-1) grouped by the part of the day they fall in
+_CURVE_STEPS = [i / (CURVE_POINTS - 1) for i in range(1, CURVE_POINTS - 1)]
+_EARLY_STEPS = tuple(t for t in _CURVE_STEPS if t < 0.3)
+_MID_STEPS = tuple(t for t in _CURVE_STEPS if 0.3 <= t < 0.7)
+_LATE_STEPS = tuple(t for t in _CURVE_STEPS if t >= 0.7)
+
+def _price_curve(open_price, current_price, high, low):
+    """Generate a smooth price curve from open to close
+
+    The curve follows a straight line from open to close, pulled 30% toward
+    the low in the first third of the day and toward the high in the middle
+    of the day.
+    """
+    span = current_price - open_price
+    early_pull = 0.3 * low
+    mid_pull = 0.3 * high
+
+    return ([open_price]
+            + [0.7 * (open_price + span * t) + early_pull for t in _EARLY_STEPS]
+            + [0.7 * (open_price + span * t) + mid_pull for t in _MID_STEPS]
+            + [open_price + span * t for t in _LATE_STEPS]
+            + [current_price])
+
+def _market_open(now=None):
+    """Check whether US stock markets are in (or just past) regular trading hours
+
+    Args:
+        now: Optional datetime to check, defaults to the current US/Eastern time
+
+    Returns:
+        True on weekdays between 9:30 and 16:15 Eastern
+    """
+    if now is None:
+        now = datetime.now(_MARKET_TZ)
+
+    if now.weekday() >= 5:
+        return False
+
+    minutes = now.hour * 60 + now.minute
+    # Allow a short grace period after the close for the final quote
+    return 9 * 60 + 30 <= minutes <= 16 * 60 + 15
+
+# 3x5 dot patterns for the LED-style pixel font (read-only, shared by all instances)
+_PIXEL_PATTERNS = types.MappingProxyType({
+    '0': ((0,0), (1,0), (2,0), (0,1), (2,1), (0,2), (2,2), (0,3), (2,3), (0,4), (1,4), (2,4)),
+    '1': ((1,0), (1,1), (1,2), (1,3), (1,4)),
+    '2': ((0,0), (1,0), (2,0), (2,1), (0,2), (1,2), (2,2), (0,3), (0,4), (1,4), (2,4)),
+    '3': ((0,0), (1,0), (2,0), (2,1), (0,2), (1,2), (2,2), (2,3), (0,4), (1,4), (2,4)),
+    '4': ((0,0), (2,0), (0,1), (2,1), (0,2), (1,2), (2,2), (2,3), (2,4)),
+    '5': ((0,0), (1,0), (2,0), (0,1), (0,2), (1,2), (2,2), (2,3), (0,4), (1,4), (2,4)),
+    '6': ((0,0), (1,0), (2,0), (0,1), (0,2), (1,2), (2,2), (0,3), (2,3), (0,4), (1,4), (2,4)),
+    '7': ((0,0), (1,0), (2,0), (2,1), (1,2), (1,3), (1,4)),
+    '8': ((0,0), (1,0), (2,0), (0,1), (2,1), (0,2), (1,2), (2,2), (0,3), (2,3), (0,4), (1,4), (2,4)),
+    '9': ((0,0), (1,0), (2,0), (0,1), (2,1), (0,2), (1,2), (2,2), (2,3), (0,4), (1,4), (2,4)),
+    '.': ((1,4),),
+    ',': ((1,3), (0,4)),
+    '+': ((1,1), (0,2), (1,2), (2,2), (1,3)),
+    '-': ((0,2), (1,2), (2,2)),
+    '%': ((0,0), (2,0), (2,1), (1,2), (0,3), (0,4), (2,4)),
+    ' ': (),
+
+    # Letters for stock symbols
+    'A': ((0,0), (1,0), (2,0), (0,1), (2,1), (0,2), (1,2), (2,2), (0,3), (2,3), (0,4), (2,4)),
+    'B': ((0,0), (1,0), (0,1), (2,1), (0,2), (1,2), (0,3), (2,3), (0,4), (1,4)),
+    'C': ((0,0), (1,0), (2,0), (0,1), (0,2), (0,3), (0,4), (1,4), (2,4)),
+    'D': ((0,0), (1,0), (0,1), (2,1), (0,2), (2,2), (0,3), (2,3), (0,4), (1,4)),
+    'E': ((0,0), (1,0), (2,0), (0,1), (0,2), (1,2), (0,3), (0,4), (1,4), (2,4)),
+    'F': ((0,0), (1,0), (2,0), (0,1), (0,2), (1,2), (0,3), (0,4)),
+    'G': ((0,0), (1,0), (2,0), (0,1), (0,2), (1,2), (2,2), (0,3), (2,3), (0,4), (1,4), (2,4)),
+    'H': ((0,0), (2,0), (0,1), (2,1), (0,2), (1,2), (2,2), (0,3), (2,3), (0,4), (2,4)),
+    'I': ((0,0), (1,0), (2,0), (1,1), (1,2), (1,3), (0,4), (1,4), (2,4)),
+    'J': ((2,0), (2,1), (2,2), (0,3), (2,3), (0,4), (1,4), (2,4)),
+    'K': ((0,0), (2,0), (0,1), (2,1), (0,2), (1,2), (0,3), (2,3), (0,4), (2,4)),
+    'L': ((0,0), (0,1), (0,2), (0,3), (0,4), (1,4), (2,4)),
+    'M': ((0,0), (2,0), (0,1), (1,1), (2,1), (0,2), (2,2), (0,3), (2,3), (0,4), (2,4)),
+    'N': ((0,0), (2,0), (0,1), (1,1), (2,1), (0,2), (2,2), (0,3), (2,3), (0,4), (2,4)),
+    'O': ((0,0), (1,0), (2,0), (0,1), (2,1), (0,2), (2,2), (0,3), (2,3), (0,4), (1,4), (2,4)),
+    'P': ((0,0), (1,0), (2,0), (0,1), (2,1), (0,2), (1,2), (2,2), (0,3), (0,4)),
+    'Q': ((0,0), (1,0), (2,0), (0,1), (2,1), (0,2), (2,2), (0,3), (1,3), (2,3), (1,4), (2,4)),
+    'R': ((0,0), (1,0), (2,0), (0,1), (2,1), (0,2), (1,2), (0,3), (2,3), (0,4), (2,4)),
+    'S': ((0,0), (1,0), (2,0), (0,1), (0,2), (1,2), (2,2), (2,3), (0,4), (1,4), (2,4)),
+    'T': ((0,0), (1,0), (2,0), (1,1), (1,2), (1,3), (1,4)),
+    'U': ((0,0), (2,0), (0,1), (2,1), (0,2), (2,2), (0,3), (2,3), (0,4), (1,4), (2,4)),
+    'V': ((0,0), (2,0), (0,1), (2,1), (0,2), (2,2), (0,3), (2,3), (1,4)),
+    'W': ((0,0), (2,0), (0,1), (2,1), (0,2), (2,2), (0,3), (1,3), (2,3), (0,4), (2,4)),
+    'X': ((0,0), (2,0), (0,1), (2,1), (1,2), (0,3), (2,3), (0,4), (2,4)),
+    'Y': ((0,0), (2,0), (0,1), (2,1), (1,2), (1,3), (1,4)),
+    'Z': ((0,0), (1,0), (2,0), (2,1), (1,2), (0,3), (0,4), (1,4), (2,4))
+})
+
+# Each pattern packed into 15 bits, bit (y * 3 + x) set for a lit dot
+_GLYPH_BITS = types.MappingProxyType({
+    char: sum(1 << (y * 3 + x) for x, y in dots)
+    for char, dots in _PIXEL_PATTERNS.items()
+})
+
+@functools.lru_cache(maxsize=None)
+def _scaled_pattern(char, dot_size):
+    """Return the dot rectangles of a pixel-font character scaled by dot_size
+
+    Horizontally adjacent dots are merged into a single rectangle. Each
+    rectangle is an (x0, y0, x1, y1) tuple relative to the character origin.
+    """
+    rects = []
+    bits = _GLYPH_BITS.get(char, 0)
+    while bits:
+        # Take the lowest lit dot, then extend it over the rest of its run
+        index = (bits & -bits).bit_length() - 1
+        dx, dy = index % 3, index // 3
+        run = 1
+        while dx + run < 3 and bits & (1 << (index + run)):
+            run += 1
+        bits &= ~(((1 << run) - 1) << index)
+
+        rects.append((dx * dot_size, dy * dot_size,
+                      (dx + run) * dot_size - 1, (dy + 1) * dot_size - 1))
+    return tuple(rects)
+
 class StockPlugin(DisplayPlugin):
     """Plugin for displaying stock ticker information with visual graph and area highlighting"""
 
@@ -23,12 +180,14 @@ class StockPlugin(DisplayPlugin):
         super().__init__(matrix, config)
         self.name = "stock"
         self.description = "Stock ticker display with visual graph and area highlighting"
+        self.draws_full_frame = True  # blits full-frame images or clears
 
         # Default configuration
         self.config.setdefault('symbols', ['AAPL', 'MSFT', 'AMZN'])
         self.config.setdefault('api_key', '')
         self.config.setdefault('update_interval', 900)  # 15 minutes by default
         self.config.setdefault('rotation_interval', 4)  # 4 seconds per stock
+        self.config.setdefault('market_hours_only', True)  # Skip refreshes while markets are closed
 
         # Internal state
         self.last_update = 0
@@ -36,8 +195,38 @@ class StockPlugin(DisplayPlugin):
         self.stock_data = {}
         self.stock_error = {}
         self.stock_images = {}
+        self._image_digests = {}
+        self._panel_background = None
+        self._image_cache_dir = None
         self.current_stock_idx = 0
         self.valid_symbols = []
+        self._etags = {}
+        self._quote_cache = FileCache('finnhub')
+        self._last_modified = {}
+        self._backoff = {}
+        self._next_retry_at = {}
+        self._api_key_cached = None
+        self._api_key_checked_at = 0
+
+        # Quotes are fetched on a background thread; the lock guards the
+        # state that render() reads (valid_symbols, stock_images,
+        # stock_error and current_stock_idx)
+        self._fetch_thread = None
+        self._lock = threading.Lock()
+        self._shown_image = None  # stock image last pushed to the matrix
+
+        # Keep-alive HTTP session shared by all quote requests
+        self._session = requests.Session()
+        self._session.headers['User-Agent'] = 'InfoCube Stock Display/1.0'
+        # One pooled connection per fetch worker, with quick retries of
+        # transient errors and rate limiting
+        self._session.mount('https://', HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=MAX_FETCH_WORKERS,
+            max_retries=Retry(total=2, backoff_factor=0.3,
+                              status_forcelist=[429, 502, 503, 504],
+                              raise_on_status=False)
+        ))
 
         # Font loading
         self.font = graphics.Font()
@@ -63,40 +252,33 @@ class StockPlugin(DisplayPlugin):
         """Set up the stock plugin"""
         # Load fonts
         try:
-            self.font_small.LoadFont("resources/fonts/4x6.bdf")
-            self.font.LoadFont("resources/fonts/7x13.bdf")  # Fall back to standard font
+            self.font_small = load_font("resources/fonts/4x6.bdf")
+            self.font = load_font("resources/fonts/7x13.bdf")  # Fall back to standard font
 
             try:
-                self.font_large.LoadFont("resources/fonts/9x18.bdf")
+                self.font_large = load_font("resources/fonts/9x18.bdf")
             except (IOError, OSError, RuntimeError):
                 logger.warning("9x18 font not available, using standard font instead")
                 self.font_large = self.font
         except Exception as e:
-            logger.error(f"Error loading fonts: {e}")
+            logger.error("Error loading fonts: %s", e)
 
         # Check configuration
-        logger.info(f"Stock plugin configuration: {self.config}")
+        logger.info("Stock plugin configuration: %s", self.config)
 
-        # Check for API key
+        # Check for API key, re-reading config.json on every activation
+        self._api_key_cached = None
         if not self.config.get('api_key'):
             logger.warning("No Finnhub API key configured in plugin settings")
-            # Try to get API key from config file
-            try:
-                config_path = os.path.join(os.path.dirname(__file__), '../../config.json')
-                if os.path.exists(config_path):
-                    with open(config_path, 'r') as f:
-                        config_data = json.load(f)
-                        api_key = config_data.get('api_keys', {}).get('finnhub', '')
-                        if api_key:
-                            logger.info("Found Finnhub API key in config.json")
-                            self.config['api_key'] = api_key
-                        else:
-                            logger.warning("No Finnhub API key found in config.json")
-            except Exception as e:
-                logger.error(f"Error reading config.json: {e}")
+            if self._get_api_key():
+                logger.info("Found Finnhub API key in config.json")
+            else:
+                logger.warning("No Finnhub API key found in config.json")
 
-        # Initial data fetch
-        self._fetch_stock_data()
+        # Drop stale rendered images, then start the initial data fetch
+        self._prune_image_cache()
+        self._start_fetch()
+        self.last_update = 0
 
     def _get_api_key(self):
         """Get the API key, checking multiple possible locations"""
@@ -105,163 +287,251 @@ class StockPlugin(DisplayPlugin):
         if api_key:
             return api_key
 
+        # Use the result of a recent config.json lookup if we have one
+        if self._api_key_cached is not None:
+            if self._api_key_cached or time.time() - self._api_key_checked_at < API_KEY_RECHECK_INTERVAL:
+                return self._api_key_cached
+
         # If not found, try the main config file
+        api_key = ''
         try:
-            config_path = os.path.join(os.path.dirname(__file__), '../../config.json')
-            if os.path.exists(config_path):
-                with open(config_path, 'r') as f:
-                    config_data = json.load(f)
+            if os.path.exists(_CONFIG_PATH):
+                with open(_CONFIG_PATH, 'rb') as f:
+                    config_data = json_loads(f.read())
                     api_key = config_data.get('api_keys', {}).get('finnhub', '')
                     if api_key:
                         # Save it to the plugin config for future use
                         self.config['api_key'] = api_key
-                        return api_key
         except Exception as e:
-            logger.error(f"Error reading config.json for API key: {e}")
+            logger.error("Error reading config.json for API key: %s", e)
+
+        # Cache the result; a missing key is rechecked after a while
+        self._api_key_cached = api_key
+        self._api_key_checked_at = time.time()
+        return api_key
+
+    def _start_fetch(self, use_cache=True):
+        """Fetch stock data on a background thread unless a fetch is running
+
+        Args:
+            use_cache: Passed on to _fetch_stock_data()
+        """
+        if self._fetch_thread and self._fetch_thread.is_alive():
+            return
+
+        self._fetch_thread = threading.Thread(target=self._fetch_stock_data, args=(use_cache,))
+        self._fetch_thread.daemon = True  # Don't hold up shutdown on a slow request
+        self._fetch_thread.start()
+
+    def _fetch_stock_data(self, use_cache=True):
+        """Fetch stock data from Finnhub API using the quote endpoint for free tier
 
-        return ''
+        Runs on the background fetch thread. Results are built up locally and
+        swapped in under the lock, so render() never sees a partial update.
+
+        Args:
+            use_cache: Reuse quotes cached on disk within the last update
+                interval. The update timer turns this off, as its interval
+                has already elapsed and the cache times, stamped when the
+                responses arrive, lag it slightly
+        """
+        stock_error = dict(self.stock_error)
 
-    def _fetch_stock_data(self):
-        """Fetch stock data from Finnhub API using the quote endpoint for free tier"""
         api_key = self._get_api_key()
         if not api_key:
             logger.error("No API key configured for stock data")
             for symbol in self.config.get('symbols', []):
                 if symbol and len(symbol.strip()) > 0:
-                    self.stock_error[symbol] = "No API key configured"
+                    stock_error[symbol] = "No API key configured"
+            with self._lock:
+                self.stock_error = stock_error
             return
 
-        logger.info(f"Using Finnhub API key: {api_key[:4]}...{api_key[-4:] if len(api_key) > 8 else ''}")
-
-        # Reset valid symbols list
-        self.valid_symbols = []
-
-        # Fetch data for each symbol
-        for i, symbol in enumerate(self.config.get('symbols', [])):
-            if not symbol or len(symbol.strip()) == 0:
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Using Finnhub API key: %s...%s",
+                        api_key[:4], api_key[-4:] if len(api_key) > 8 else '')
+
+        # Clean up the symbols - make sure they're properly formatted (uppercase and trim spaces)
+        symbols = [symbol.strip().upper() for symbol in self.config.get('symbols', [])
+                   if symbol and len(symbol.strip()) > 0]
+
+        # Symbols that failed recently are left alone until their backoff expires
+        now = time.time()
+        due = [symbol for symbol in symbols if now >= self._next_retry_at.get(symbol, 0)]
+
+        # Fetch due symbols concurrently over the shared keep-alive session
+        results = {}
+        if due:
+            with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(due))) as executor:
+                results = dict(zip(due, executor.map(lambda symbol: self._fetch_quote(symbol, api_key, use_cache), due)))
+
+        # Merge the results in configured order
+        valid_symbols = []
+        for symbol in symbols:
+            if symbol not in results:
+                continue  # Still backing off, keep the previous error
+
+            stock_data, error = results[symbol]
+            if error:
+                # Double the wait after each consecutive failure. It's timed
+                # from the start of this fetch, like the refresh timer, and
+                # ends half a refresh early so the refresh it lines up with
+                # isn't skipped if it comes a little early
+                backoff = self._backoff.get(symbol)
+                backoff = min(backoff * 2 if backoff else self.config['update_interval'],
+                              MAX_RETRY_BACKOFF)
+                self._backoff[symbol] = backoff
+                self._next_retry_at[symbol] = now + backoff - self.config['update_interval'] / 2
+                stock_error[symbol] = error
                 continue
 
-            # Clean up the symbol - make sure it's properly formatted (uppercase and trim spaces)
-            symbol = symbol.strip().upper()
-
-            # Using the quote endpoint which is available in the free tier
-            url = "https://finnhub.io/api/v1/quote"
-            params = {
-                'symbol': symbol,
-                'token': api_key
-            }
+            # Success - store data and clear any previous error and backoff
+            self.stock_data[symbol] = stock_data
+            valid_symbols.append(symbol)
+            stock_error.pop(symbol, None)
+            self._backoff.pop(symbol, None)
+            self._next_retry_at.pop(symbol, None)
 
-            logger.info(f"Fetching stock data for {symbol} using quote endpoint")
-
-            try:
-                # Add timeout and headers for better API behavior
-                headers = {
-                    'User-Agent': 'InfoCube Stock Display/1.0'
-                }
-
-                response = requests.get(
-                    url, 
-                    params=params, 
-                    headers=headers,
-                    timeout=10
-                )
+        # Create individual stock images after fetching all stock data
+        stock_images, image_digests = self._create_stock_images(valid_symbols)
 
-                # Log response status
-                logger.info(f"API response status for {symbol}: {response.status_code}")
+        with self._lock:
+            self.valid_symbols = valid_symbols
+            self.stock_images = stock_images
+            self._image_digests = image_digests
+            self.stock_error = stock_error
 
-                # Log response details if error occurs
-                if response.status_code != 200:
-                    logger.error(f"API error for {symbol}: HTTP {response.status_code}")
-                    logger.error(f"Response content: {response.text[:200]}")
-                    self.stock_error[symbol] = f"API error: HTTP {response.status_code}"
-                    continue
+            # Reset current stock index if needed
+            if self.current_stock_idx >= len(valid_symbols):
+                self.current_stock_idx = 0
 
-                data = response.json()
-
-                # Extract needed data from quote endpoint
-                current_price = data.get('c', 0)
-                previous_close = data.get('pc', 0)
-                high = data.get('h', current_price)
-                low = data.get('l', current_price)
-                open_price = data.get('o', previous_close)
-
-                # Calculate change
-                price_change = current_price - previous_close
-                percent_change = (price_change / previous_close * 100) if previous_close > 0 else 0
-
-                # Create data points for the graph
-                num_points = 40  # More points for a smoother graph
-                prices = []
-
-                # Use open/high/low/close to create a coherent price series
-                if open_price > 0 and high > 0 and low > 0 and current_price > 0:
-                    # Generate a smooth price curve from open to close with reasonable variations
-                    prices = [open_price]
-
-                    # Divide the day into segments
-                    for i in range(1, num_points-1):
-                        # Linear interpolation with some variation
-                        t = i / (num_points - 1)
-
-                        # Base price (straight line from open to close)
-                        base_price = open_price + (current_price - open_price) * t
-
-                        # Add slight variation to make the line more interesting
-                        # Early in the day, tend toward low; middle of the day, tend toward high
-                        if t < 0.3:  # First third of the day
-                            target = base_price + (low - base_price) * 0.3
-                        elif t < 0.7:  # Middle of the day
-                            target = base_price + (high - base_price) * 0.3
-                        else:  # Last third of the day
-                            # Move toward closing price
-                            target = base_price
-
-                        prices.append(target)
-
-                    # Make sure the last price is the current price
-                    prices.append(current_price)
-                else:
-                    # Fallback with placeholder data
-                    prices = [previous_close] * 5 + [current_price] * 5
+    def _fetch_quote(self, symbol, api_key, use_cache=True):
+        """Fetch the quote for a single symbol
 
-                if current_price == 0:
-                    logger.error(f"No price data found for {symbol}")
-                    self.stock_error[symbol] = "No price data"
-                    continue
+        Runs on a worker thread, so it only reads plugin state.
 
-                # Success - store data
-                self.stock_data[symbol] = {
-                    'prices': prices,
-                    'change': price_change,
-                    'percent_change': percent_change,
-                    'current': current_price,
-                    'high': high,
-                    'low': low,
-                    'open': open_price,
-                    'previous_close': previous_close
-                }
+        Args:
+            symbol: Cleaned-up stock symbol
+            api_key: Finnhub API key
+            use_cache: Reuse a quote cached within the last update interval
+                instead of requesting it
 
-                # Add to valid symbols list
-                self.valid_symbols.append(symbol)
+        Returns:
+            Tuple of (stock data dict, error message); one of them is None
+        """
+        # Using the quote endpoint which is available in the free tier
+        url = "https://finnhub.io/api/v1/quote"
+        params = {
+            'symbol': symbol,
+            'token': api_key
+        }
 
-                logger.info(f"Successfully loaded stock data for {symbol}: current price = {current_price}, previous close = {previous_close}, change = {price_change}")
+        logger.info("Fetching stock data for %s using quote endpoint", symbol)
 
-                # Clear any previous error
-                if symbol in self.stock_error:
-                    del self.stock_error[symbol]
+        try:
+            # Reuse a quote fetched within the last update interval, e.g.
+            # after a restart or when switching back to this plugin
+            cached, cached_at = self._quote_cache.get_entry(symbol)
+            if not isinstance(cached, dict) or 'quote' not in cached:
+                cached = None
+
+            if use_cache and cached and time.time() - cached_at < self.config['update_interval']:
+                logger.info("Using cached quote for %s", symbol)
+                data = cached['quote']
+            else:
+                # Ask the server to skip the body if the quote is unchanged,
+                # falling back to the validators saved with the cached quote
+                headers = {}
+                if symbol in self.stock_data or cached:
+                    etag = self._etags.get(symbol) or (cached and cached.get('etag'))
+                    last_modified = (self._last_modified.get(symbol)
+                                     or (cached and cached.get('last_modified')))
+                    if etag:
+                        headers['If-None-Match'] = etag
+                    if last_modified:
+                        headers['If-Modified-Since'] = last_modified
+
+                response = self._session.get(
+                    url,
+                    params=params,
+                    headers=headers,
+                    timeout=(3.05, 10)  # connect, read
+                )
 
-                # Add a small delay between requests to avoid rate limiting
-                time.sleep(0.5)
+                # Log response status
+                logger.info("API response status for %s: %s", symbol, response.status_code)
+
+                if response.status_code == 304 and (cached or symbol in self.stock_data):
+                    # Quote not modified - keep the data we already have
+                    if not cached:
+                        return self.stock_data[symbol], None
+                    data = cached['quote']
+                    etag = cached.get('etag')
+                    last_modified = cached.get('last_modified')
+                elif response.status_code != 200:
+                    # Log response details if error occurs
+                    logger.error("API error for %s: HTTP %s", symbol, response.status_code)
+                    if logger.isEnabledFor(logging.ERROR):
+                        logger.error("Response content: %s", response.text[:200])
+                    return None, f"API error: HTTP {response.status_code}"
+                else:
+                    data = json_loads(response.content)
+                    etag = response.headers.get('ETag')
+                    last_modified = response.headers.get('Last-Modified')
+
+                # Remember validators for the next conditional request, in
+                # memory and alongside the cached quote for after a restart
+                self._etags[symbol] = etag
+                self._last_modified[symbol] = last_modified
+                if data.get('c'):
+                    self._quote_cache.set(symbol, {
+                        'quote': data,
+                        'etag': etag,
+                        'last_modified': last_modified
+                    })
+
+            # Extract needed data from quote endpoint
+            current_price = data.get('c', 0)
+            previous_close = data.get('pc', 0)
+            high = data.get('h', current_price)
+            low = data.get('l', current_price)
+            open_price = data.get('o', previous_close)
+
+            if current_price == 0:
+                logger.error("No price data found for %s", symbol)
+                return None, "No price data"
+
+            # Calculate change
+            price_change = current_price - previous_close
+            percent_change = (price_change / previous_close * 100) if previous_close > 0 else 0
+
+            # Use open/high/low/close to create a coherent price series
+            if open_price > 0 and high > 0 and low > 0 and current_price > 0:
+                prices = _price_curve(open_price, current_price, high, low)
+            else:
+                # Fallback with placeholder data
+                prices = [previous_close] * 5 + [current_price] * 5
+
+            logger.info("Successfully loaded stock data for %s: current price = %s, previous close = %s, change = %s",
+                        symbol, current_price, previous_close, price_change)
+
+            return {
+                'prices': prices,
+                'change': price_change,
+                'percent_change': percent_change,
+                'current': current_price,
+                'high': high,
+                'low': low,
+                'open': open_price,
+                'previous_close': previous_close
+            }, None
 
-            except Exception as e:
-                import traceback
-                logger.error(f"Error fetching data for {symbol}: {e}")
+        except Exception as e:
+            import traceback
+            logger.error("Error fetching data for %s: %s", symbol, e)
+            if logger.isEnabledFor(logging.ERROR):
                 logger.error(traceback.format_exc())
-                self.stock_error[symbol] = str(e)
-
-        # Create individual stock images after fetching all stock data
-        self._create_stock_images()
-        self.last_update = 0
+            return None, str(e)
 
     def _draw_pixel_text(self, draw, text, x, y, color, scaled=False):
         """Draw text using LED-style pixel patterns"""
@@ -274,79 +544,13 @@ class StockPlugin(DisplayPlugin):
         digit_width = 3 * dot_size
         digit_height = 5 * dot_size
 
-        # Define 3x5 dot patterns for characters
-        patterns = {
-            '0': [(0,0), (1,0), (2,0), (0,1), (2,1), (0,2), (2,2), (0,3), (2,3), (0,4), (1,4), (2,4)],
-            '1': [(1,0), (1,1), (1,2), (1,3), (1,4)],
-            '2': [(0,0), (1,0), (2,0), (2,1), (0,2), (1,2), (2,2), (0,3), (0,4), (1,4), (2,4)],
-            '3': [(0,0), (1,0), (2,0), (2,1), (0,2), (1,2), (2,2), (2,3), (0,4), (1,4), (2,4)],
-            '4': [(0,0), (2,0), (0,1), (2,1), (0,2), (1,2), (2,2), (2,3), (2,4)],
-            '5': [(0,0), (1,0), (2,0), (0,1), (0,2), (1,2), (2,2), (2,3), (0,4), (1,4), (2,4)],
-            '6': [(0,0), (1,0), (2,0), (0,1), (0,2), (1,2), (2,2), (0,3), (2,3), (0,4), (1,4), (2,4)],
-            '7': [(0,0), (1,0), (2,0), (2,1), (1,2), (1,3), (1,4)],
-            '8': [(0,0), (1,0), (2,0), (0,1), (2,1), (0,2), (1,2), (2,2), (0,3), (2,3), (0,4), (1,4), (2,4)],
-            '9': [(0,0), (1,0), (2,0), (0,1), (2,1), (0,2), (1,2), (2,2), (2,3), (0,4), (1,4), (2,4)],
-            '.': [(1,4)],
-            ',': [(1,3), (0,4)],
-            '+': [(1,1), (0,2), (1,2), (2,2), (1,3)],
-            '-': [(0,2), (1,2), (2,2)],
-            '%': [(0,0), (2,0), (2,1), (1,2), (0,3), (0,4), (2,4)],
-            ' ': []
-        }
-
-        # Add letter patterns for stock symbols
-        patterns.update({
-            'A': [(0,0), (1,0), (2,0), (0,1), (2,1), (0,2), (1,2), (2,2), (0,3), (2,3), (0,4), (2,4)],
-            'B': [(0,0), (1,0), (0,1), (2,1), (0,2), (1,2), (0,3), (2,3), (0,4), (1,4)],
-            'C': [(0,0), (1,0), (2,0), (0,1), (0,2), (0,3), (0,4), (1,4), (2,4)],
-            'D': [(0,0), (1,0), (0,1), (2,1), (0,2), (2,2), (0,3), (2,3), (0,4), (1,4)],
-            'E': [(0,0), (1,0), (2,0), (0,1), (0,2), (1,2), (0,3), (0,4), (1,4), (2,4)],
-            'F': [(0,0), (1,0), (2,0), (0,1), (0,2), (1,2), (0,3), (0,4)],
-            'G': [(0,0), (1,0), (2,0), (0,1), (0,2), (1,2), (2,2), (0,3), (2,3), (0,4), (1,4), (2,4)],
-            'H': [(0,0), (2,0), (0,1), (2,1), (0,2), (1,2), (2,2), (0,3), (2,3), (0,4), (2,4)],
-            'I': [(0,0), (1,0), (2,0), (1,1), (1,2), (1,3), (0,4), (1,4), (2,4)],
-            'J': [(2,0), (2,1), (2,2), (0,3), (2,3), (0,4), (1,4), (2,4)],
-            'K': [(0,0), (2,0), (0,1), (2,1), (0,2), (1,2), (0,3), (2,3), (0,4), (2,4)],
-            'L': [(0,0), (0,1), (0,2), (0,3), (0,4), (1,4), (2,4)],
-            'M': [(0,0), (2,0), (0,1), (1,1), (2,1), (0,2), (2,2), (0,3), (2,3), (0,4), (2,4)],
-            'N': [(0,0), (2,0), (0,1), (1,1), (2,1), (0,2), (2,2), (0,3), (2,3), (0,4), (2,4)],
-            'O': [(0,0), (1,0), (2,0), (0,1), (2,1), (0,2), (2,2), (0,3), (2,3), (0,4), (1,4), (2,4)],
-            'P': [(0,0), (1,0), (2,0), (0,1), (2,1), (0,2), (1,2), (2,2), (0,3), (0,4)],
-            'Q': [(0,0), (1,0), (2,0), (0,1), (2,1), (0,2), (2,2), (0,3), (1,3), (2,3), (1,4), (2,4)],
-            'R': [(0,0), (1,0), (2,0), (0,1), (2,1), (0,2), (1,2), (0,3), (2,3), (0,4), (2,4)],
-            'S': [(0,0), (1,0), (2,0), (0,1), (0,2), (1,2), (2,2), (2,3), (0,4), (1,4), (2,4)],
-            'T': [(0,0), (1,0), (2,0), (1,1), (1,2), (1,3), (1,4)],
-            'U': [(0,0), (2,0), (0,1), (2,1), (0,2), (2,2), (0,3), (2,3), (0,4), (1,4), (2,4)],
-            'V': [(0,0), (2,0), (0,1), (2,1), (0,2), (2,2), (0,3), (2,3), (1,4)],
-            'W': [(0,0), (2,0), (0,1), (2,1), (0,2), (2,2), (0,3), (1,3), (2,3), (0,4), (2,4)],
-            'X': [(0,0), (2,0), (0,1), (2,1), (1,2), (0,3), (2,3), (0,4), (2,4)],
-            'Y': [(0,0), (2,0), (0,1), (2,1), (1,2), (1,3), (1,4)],
-            'Z': [(0,0), (1,0), (2,0), (2,1), (1,2), (0,3), (0,4), (1,4), (2,4)]
-        })
-
         # Position tracking
         cursor_x = x
 
         # Draw each character
         for char in clean_text:
-            char = char.upper()  # Convert to uppercase
-            pattern = patterns.get(char, [])
-
-            # Draw the dots for this character
-            for dx, dy in pattern:
-                px = cursor_x + dx * dot_size
-                py = y + dy * dot_size
-
-                # Draw a square for each dot
-                if dot_size == 1:
-                    # Single pixel
-                    draw.point((px, py), fill=color)
-                else:
-                    # Larger dot
-                    draw.rectangle(
-                        [(px, py), (px + dot_size - 1, py + dot_size - 1)],
-                        fill=color
-                    )
+            for x0, y0, x1, y1 in _scaled_pattern(char.upper(), dot_size):
+                draw.rectangle([(cursor_x + x0, y + y0), (cursor_x + x1, y + y1)], fill=color)
 
             # Move cursor to next character position
             cursor_x += digit_width + dot_gap
@@ -371,138 +575,255 @@ class StockPlugin(DisplayPlugin):
         lighter_b = int(b + (255 - b) * factor)
         return (lighter_r, lighter_g, lighter_b)
 
-    def _create_stock_images(self):
-        """Create individual image for each stock"""
-        width = self.matrix.width
-        height = self.matrix.height
+    def _get_panel_background(self, width, height, left_section_width):
+        """Get the static stock panel background, rendering it on first use
 
-        # Clear the current stock images dict
-        self.stock_images = {}
+        Args:
+            width: Panel width in pixels
+            height: Panel height in pixels
+            left_section_width: Width of the text section left of the divider
 
-        # Create an image for each valid stock
-        for symbol in self.valid_symbols:
-            # Create a new image
+        Returns:
+            PIL Image with the left section fill and divider line
+        """
+        key = (width, height, left_section_width)
+        if self._panel_background is None or self._panel_background[0] != key:
             image = Image.new('RGB', (width, height), (0, 0, 0))
             draw = ImageDraw.Draw(image)
 
-            stock_data = self.stock_data[symbol]
+            # Fill left section with dark gray background
+            draw.rectangle([(0, 0), (left_section_width - 1, height - 1)], fill=(5, 5, 5))
 
-            # Determine colors based on price change
-            price_change = stock_data['change']
-            positive_change = price_change >= 0
+            # Draw divider line
+            divider_color = (20, 20, 20)
+            draw.line([(left_section_width, 0), (left_section_width, height - 1)], fill=divider_color)
 
-            # Set colors based on whether change is positive or negative
-            primary_color = (0, 255, 0) if positive_change else (255, 0, 0)  # Green if up, red if down
-            area_color = self._lighten_color(primary_color, 0.6)  # Much lighter version for area
+            self._panel_background = (key, image)
 
-            # Layout parameters
-            # Left section: Symbol, price, percent
-            # Right section: Graph
-            left_section_width = 31  # Seems to match what's in your image
-            right_section_width = width - left_section_width - 2
+        return self._panel_background[1]
 
-            # Fill left section with dark gray background
-            for y in range(height):
-                for x in range(left_section_width):
-                    draw.point((x, y), fill=(5, 5, 5))  # Dark gray
-
-            # Draw divider line (blue like in your image)
-            divider_color = (20, 20, 20)  # Light blue
-            for y in range(height):
-                draw.point((left_section_width, y), fill=divider_color)
-
-            # 1. Draw stock symbol in the top left
-            # Scale up the text for better readability
-            self._draw_pixel_text(draw, symbol, 0, 0, (255, 255, 255), scaled=True)
-
-            # 2. Draw price with scaled-up text
-            price = stock_data['current']
-            price_text = f"{price:.1f}"
-            if price < 10:
-                price_text = f"{price:.2f}"
-            elif price >= 100:
-                price_text = f"{int(price)}"
-
-            self._draw_pixel_text(draw, price_text, 0, 11, primary_color, scaled=True)
-
-            # 3. Draw percent change
-            percent_change = stock_data['percent_change']
-            percent_text = f"{'+' if percent_change >= 0 else ''}{percent_change:.1f}%"
-            self._draw_pixel_text(draw, percent_text, 0, 22, primary_color, scaled=False)
-
-            # 4. Draw the graph on the right side with area highlighting
-            graph_x_start = left_section_width + 1
-            graph_width = right_section_width - 1
-
-            # Get price data
-            prices = stock_data['prices']
-            if len(prices) > 1:
-                # Find min/max for proper scaling
-                min_price = min(prices)
-                max_price = max(prices)
-
-                # Add buffer to avoid graph touching the edges
-                price_range = max_price - min_price
-                if price_range < 0.01:
-                    price_range = 0.01
-
-                buffer = price_range * 0.1
-                min_price -= buffer
-                max_price += buffer
-                price_range = max_price - min_price
-
-                # Calculate points for the line graph with more granularity
-                points = []
-                num_points = min(len(prices), 40)  # Use more points for smoother curve
-
-                for i in range(num_points):
-                    # Get price at this position
-                    idx = min(i * len(prices) // num_points, len(prices) - 1)
-                    price = prices[idx]
-
-                    # Calculate x position
-                    x = graph_x_start + int(i * graph_width / (num_points - 1))
-
-                    # Calculate y position (invert y axis)
-                    normalized = (price - min_price) / price_range
-                    y = height - int(normalized * height)
-
-                    # Ensure y is within bounds
-                    y = max(1, min(height - 1, y))
-
-                    points.append((x, y))
-
-                # Draw area highlighting under the line
-                for i in range(len(points) - 1):
-                    x1, y1 = points[i]
-                    x2, y2 = points[i + 1]
-
-                    # Create a polygon that represents the area under the line segment
-                    # from current point to next point, down to bottom of chart
-                    area_points = [
-                        (x1, y1),      # Start point on line
-                        (x2, y2),      # End point on line  
-                        (x2, height),  # Bottom right
-                        (x1, height)   # Bottom left
-                    ]
-
-                    # Draw the area polygon with lighter color
-                    draw.polygon(area_points, fill=area_color)
-
-                # Draw individual points for the traced line effect (on top of area)
-                for x, y in points:
-                    draw.point((x, y), fill=primary_color)
-
-                # Then draw line segments (on top of everything)
-                for i in range(len(points) - 1):
-                    draw.line([points[i], points[i+1]], fill=primary_color, width=1)
-
-            # Store the completed image
-            self.stock_images[symbol] = image
-
-        # Reset current stock index if needed
-        if self.valid_symbols and self.current_stock_idx >= len(self.valid_symbols):
-            self.current_stock_idx = 0
+    def _stock_image_digest(self, symbol, width, height):
+        """Hash everything drawn into a stock image
+
+        Two quotes with the same digest produce identical images, so the
+        digest keys both the in-memory images and the on-disk cache.
+        """
+        stock_data = self.stock_data[symbol]
+        key = repr((IMAGE_RENDER_VERSION, symbol, width, height, tuple(stock_data['prices']),
+                    stock_data['current'], stock_data['percent_change'],
+                    stock_data['change'] >= 0))
+        return hashlib.sha1(key.encode()).hexdigest()
+
+    def _stock_image_cache_path(self, digest):
+        """Get the on-disk cache path for a stock image digest
+
+        Returns:
+            Path to the PNG file, or None if the cache is unavailable
+        """
+        if self._image_cache_dir is None:
+            try:
+                self._image_cache_dir = get_cache_dir('stock')
+            except OSError as e:
+                logger.warning("Stock image cache disabled: %s", e)
+                self._image_cache_dir = ''
+
+        if not self._image_cache_dir:
+            return None
+
+        return os.path.join(self._image_cache_dir, f"{digest}.png")
+
+    def _prune_image_cache(self, max_age=7 * 86400):
+        """Remove cached stock images that have not been used recently"""
+        try:
+            cache_dir = get_cache_dir('stock')
+            cutoff = time.time() - max_age
+            for entry in os.scandir(cache_dir):
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+        except OSError as e:
+            logger.warning("Error pruning stock image cache: %s", e)
+
+    def _draw_stock_image(self, symbol, background, left_section_width):
+        """Draw the panel image for a single stock
+
+        Args:
+            symbol: Stock symbol with data in self.stock_data
+            background: Pre-rendered panel background to draw on a copy of
+            left_section_width: Width of the text section left of the divider
+
+        Returns:
+            PIL Image for the stock
+        """
+        width, height = background.size
+        right_section_width = width - left_section_width - 2
+
+        # Start from a copy of the pre-rendered background
+        image = background.copy()
+        draw = ImageDraw.Draw(image)
+
+        stock_data = self.stock_data[symbol]
+
+        # Determine colors based on price change
+        price_change = stock_data['change']
+        positive_change = price_change >= 0
+
+        # Set colors based on whether change is positive or negative
+        primary_color = (0, 255, 0) if positive_change else (255, 0, 0)  # Green if up, red if down
+        area_color = self._lighten_color(primary_color, 0.6)  # Much lighter version for area
+
+        # 1. Draw stock symbol in the top left
+        # Scale up the text for better readability
+        self._draw_pixel_text(draw, symbol, 0, 0, (255, 255, 255), scaled=True)
+
+        # 2. Draw price with scaled-up text
+        price = stock_data['current']
+        price_text = f"{price:.1f}"
+        if price < 10:
+            price_text = f"{price:.2f}"
+        elif price >= 100:
+            price_text = f"{int(price)}"
+
+        self._draw_pixel_text(draw, price_text, 0, 11, primary_color, scaled=True)
+
+        # 3. Draw percent change
+        percent_change = stock_data['percent_change']
+        percent_text = f"{'+' if percent_change >= 0 else ''}{percent_change:.1f}%"
+        self._draw_pixel_text(draw, percent_text, 0, 22, primary_color, scaled=False)
+
+        # 4. Draw the graph on the right side with area highlighting
+        graph_x_start = left_section_width + 1
+        graph_width = right_section_width - 1
+
+        # Get price data
+        prices = stock_data['prices']
+        if len(prices) > 1:
+            # Find min/max for proper scaling
+            min_price = min(prices)
+            max_price = max(prices)
+
+            # Add buffer to avoid graph touching the edges
+            price_range = max_price - min_price
+            if price_range < 0.01:
+                price_range = 0.01
+
+            buffer = price_range * 0.1
+            min_price -= buffer
+            max_price += buffer
+            price_range = max_price - min_price
+
+            # Calculate points for the line graph with more granularity
+            num_points = min(len(prices), 40)  # Use more points for smoother curve
+            n_prices = len(prices)
+            last_step = num_points - 1
+
+            # Resample the prices, then map to screen space (x spread across
+            # the graph, y inverted and clamped to stay within bounds)
+            sampled = [prices[min(i * n_prices // num_points, n_prices - 1)]
+                       for i in range(num_points)]
+            points = [
+                (graph_x_start + i * graph_width // last_step,
+                 max(1, min(height - 1, height - int((p - min_price) / price_range * height))))
+                for i, p in enumerate(sampled)
+            ]
+
+            # Draw area highlighting under the line as a single polygon
+            # closed along the bottom of the chart
+            draw.polygon(points + [(points[-1][0], height), (points[0][0], height)],
+                         fill=area_color)
+
+            # Then draw the line as one polyline (on top of the area)
+            draw.line(points, fill=primary_color, width=1)
+
+        return image
+
+    def _draw_fallback_image(self, symbol, width, height):
+        """Draw a plain symbol and price image for when the panel can't be drawn
+
+        Args:
+            symbol: Stock symbol with data in self.stock_data
+            width: Image width
+            height: Image height
+
+        Returns:
+            PIL Image for the stock
+        """
+        image = Image.new('RGB', (width, height), (0, 0, 0))
+        font_path = "resources/fonts/7x13.bdf"
+
+        paste_glyph_text(image, load_glyph_images(font_path, (255, 255, 255), symbol),
+                         2, 10, symbol)
+
+        stock_data = self.stock_data.get(symbol, {})
+        if 'current' in stock_data:
+            price_text = f"${stock_data['current']:.2f}"
+            color = (0, 255, 0) if stock_data.get('change', 0) >= 0 else (255, 0, 0)
+            paste_glyph_text(image, load_glyph_images(font_path, color, price_text),
+                             2, 20, price_text)
+
+        return image
+
+    def _create_stock_images(self, symbols):
+        """Create individual image for each stock
+
+        Args:
+            symbols: Symbols with data in self.stock_data to draw
+
+        Returns:
+            Tuple of (dict of symbol -> image, dict of symbol -> image digest)
+        """
+        width = self.matrix.width
+        height = self.matrix.height
+
+        # Layout parameters
+        # Left section: Symbol, price, percent
+        # Right section: Graph
+        left_section_width = 31  # Seems to match what's in your image
+
+        # Static panel background shared by every stock image
+        background = self._get_panel_background(width, height, left_section_width)
+
+        # Keep images whose quote is unchanged, rebuild or load the rest
+        stock_images = {}
+        image_digests = {}
+        for symbol in symbols:
+            digest = self._stock_image_digest(symbol, width, height)
+            image_digests[symbol] = digest
+            if self._image_digests.get(symbol) == digest and symbol in self.stock_images:
+                stock_images[symbol] = self.stock_images[symbol]
+                continue
+
+            cache_path = self._stock_image_cache_path(digest)
+            if cache_path and os.path.exists(cache_path):
+                try:
+                    with Image.open(cache_path) as cached:
+                        stock_images[symbol] = cached.convert('RGB')
+                    os.utime(cache_path)
+                    continue
+                except Exception as e:
+                    logger.warning("Error reading cached image for %s: %s", symbol, e)
+
+            try:
+                image = self._draw_stock_image(symbol, background, left_section_width)
+            except Exception as e:
+                # Show the plain quote instead, and try drawing again next refresh
+                logger.error("Error drawing image for %s: %s", symbol, e)
+                del image_digests[symbol]
+                try:
+                    stock_images[symbol] = self._draw_fallback_image(symbol, width, height)
+                except Exception as e:
+                    # Leave the symbol without an image (render() clears)
+                    logger.error("Error drawing fallback image for %s: %s", symbol, e)
+                continue
+            stock_images[symbol] = image
+
+            if cache_path:
+                try:
+                    image.save(cache_path, 'PNG', compress_level=1)
+                except Exception as e:
+                    logger.warning("Error caching image for %s: %s", symbol, e)
+
+        # Symbols that are no longer valid drop out here
+        return stock_images, image_digests
 
     def update(self, delta_time):
         """Update stock ticker display"""
@@ -512,41 +833,61 @@ class StockPlugin(DisplayPlugin):
 
         # Update stock data based on interval
         if self.last_update >= self.config['update_interval']:
-            self._fetch_stock_data()
+            self.last_update = 0
+
+            # Quotes don't change outside trading hours once we have them
+            if self.valid_symbols and self.config['market_hours_only'] and not _market_open():
+                return
+
+            # Fetch in the background so a slow API doesn't stall the display
+            self._start_fetch(use_cache=False)
             self.last_rotation = 0  # Reset rotation timer after refresh
             return
 
         # Rotate stocks every few seconds
-        if self.last_rotation >= self.config['rotation_interval'] and len(self.valid_symbols) > 1:
+        if self.last_rotation >= self.config['rotation_interval']:
             self.last_rotation = 0
-            self.current_stock_idx = (self.current_stock_idx + 1) % len(self.valid_symbols)
+            with self._lock:
+                if len(self.valid_symbols) > 1:
+                    self.current_stock_idx = (self.current_stock_idx + 1) % len(self.valid_symbols)
+
+    def _current_image(self):
+        """Get the image of the stock on display, or None if there isn't one"""
+        with self._lock:
+            if not self.valid_symbols:
+                return None
+            return self.stock_images.get(self.valid_symbols[self.current_stock_idx])
+
+    def needs_render(self):
+        """Only redraw when the stock image changed; error screens always redraw"""
+        image = self._current_image()
+        return image is None or image is not self._shown_image
 
     def render(self, canvas):
         """Render the stock ticker display"""
-        # Clear canvas
-        canvas.Clear()
+        # Take a consistent snapshot of what the fetch thread last produced
+        with self._lock:
+            current_symbol = image = None
+            if self.valid_symbols:
+                current_symbol = self.valid_symbols[self.current_stock_idx]
+                image = self.stock_images.get(current_symbol)
+            stock_error = self.stock_error
 
         # If we have valid stocks, show the current one
-        if self.valid_symbols:
-            current_symbol = self.valid_symbols[self.current_stock_idx]
-
-            if current_symbol in self.stock_images:
-                # Display the pre-rendered image for this stock
-                canvas.SetImage(self.stock_images[current_symbol])
-                return
+        if current_symbol is not None:
+            # Valid symbols have a pre-rendered image (a plain fallback if
+            # their panel couldn't be drawn, none if that failed too); it
+            # covers the whole canvas, so no Clear() is needed first
+            if image is not None:
+                canvas.SetImage(image)
             else:
-                # Fallback if image not found - should not happen
-                graphics.DrawText(canvas, self.font, 2, 10, 
-                                self.colors['white'], current_symbol)
-
-                stock_data = self.stock_data.get(current_symbol, {})
-                if 'current' in stock_data:
-                    price_text = f"${stock_data['current']:.2f}"
-                    color = self.colors['green'] if stock_data.get('change', 0) >= 0 else self.colors['red']
-                    graphics.DrawText(canvas, self.font, 2, 20, color, price_text)
-                return
+                canvas.Clear()
+            self._shown_image = image
+            return
 
         # No valid stocks - show error message
+        self._shown_image = None
+        canvas.Clear()
         valid_symbols = self.config.get('symbols', [])
         valid_symbols = [s for s in valid_symbols if s and len(s.strip()) > 0]
 
@@ -559,7 +900,7 @@ class StockPlugin(DisplayPlugin):
             return
 
         # Check for errors
-        has_errors = any(symbol in self.stock_error for symbol in valid_symbols)
+        has_errors = any(symbol in stock_error for symbol in valid_symbols)
 
         if has_errors:
             # Display error message
@@ -569,9 +910,15 @@ class StockPlugin(DisplayPlugin):
                              self.colors['error'], "Error")
 
             # Display the specific error for debugging
-            first_error = next((self.stock_error[symbol] for symbol in valid_symbols if symbol in self.stock_error), "Unknown")
+            first_error = next((stock_error[symbol] for symbol in valid_symbols if symbol in stock_error), "Unknown")
             if len(first_error) > 20:
                 first_error = first_error[:17] + "..."
             graphics.DrawText(canvas, self.font_small, 2, 31, 
                              self.colors['white'], first_error)
-            return
\ No newline at end of file
+            return
+
+    def cleanup(self):
+        """Clean up resources"""
+        # Release idle keep-alive connections while the plugin is inactive
+        self._session.close()
+        super().cleanup()
\ No newline at end of file
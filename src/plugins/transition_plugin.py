@@ -5,6 +5,7 @@ import time
 import os
 
 from .base_plugin import DisplayPlugin
+from ._fonts import load_font
 
 class TransitionPlugin(DisplayPlugin):
     """Plugin for displaying transitions between plugins in cycling mode"""
@@ -28,12 +29,14 @@ class TransitionPlugin(DisplayPlugin):
         # Font loading
         self.font = None
 
+        # Gray ramp so fades index a color instead of creating one per frame
+        self._gray = [graphics.Color(i, i, i) for i in range(256)]
+
     def setup(self):
         """Set up the transition plugin"""
         try:
             # Load font for text rendering
-            self.font = graphics.Font()
-            self.font.LoadFont("resources/fonts/7x13.bdf")
+            self.font = load_font("resources/fonts/7x13.bdf")
         except Exception as e:
             print(f"Error loading font: {e}")
             self.font = None
@@ -73,7 +76,7 @@ class TransitionPlugin(DisplayPlugin):
                     x_pos = width - offset
                     y_pos = height // 2
                     graphics.DrawText(canvas, self.font, x_pos, y_pos,
-                                     graphics.Color(100, 100, 100), from_plugin)
+                                     self._gray[100], from_plugin)
 
             # Draw "to" plugin name
             if self.font:
@@ -82,7 +85,7 @@ class TransitionPlugin(DisplayPlugin):
                     x_pos = width - offset + width
                     y_pos = height // 2
                     graphics.DrawText(canvas, self.font, x_pos, y_pos,
-                                     graphics.Color(255, 255, 255), to_plugin)
+                                     self._gray[255], to_plugin)
 
         elif effect == 'fade':
             # Create a fading effect
@@ -92,18 +95,18 @@ class TransitionPlugin(DisplayPlugin):
                 to_plugin = self.config.get('to_plugin', '')
 
                 # Calculate colors based on progress
-                from_intensity = int(255 * (1.0 - progress))
-                to_intensity = int(255 * progress)
+                from_intensity = max(0, min(255, int(255 * (1.0 - progress))))
+                to_intensity = max(0, min(255, int(255 * progress)))
 
                 # Render the labels
                 if from_plugin:
-                    from_color = graphics.Color(from_intensity, from_intensity, from_intensity)
+                    from_color = self._gray[from_intensity]
                     x_pos = (width - len(from_plugin) * 7) // 2  # Approximate width
                     y_pos = height // 3
                     graphics.DrawText(canvas, self.font, x_pos, y_pos, from_color, from_plugin)
 
                 if to_plugin:
-                    to_color = graphics.Color(to_intensity, to_intensity, to_intensity)
+                    to_color = self._gray[to_intensity]
                     x_pos = (width - len(to_plugin) * 7) // 2  # Approximate width
                     y_pos = 2 * height // 3
                     graphics.DrawText(canvas, self.font, x_pos, y_pos, to_color, to_plugin)
@@ -118,4 +121,4 @@ class TransitionPlugin(DisplayPlugin):
                 x_pos = (width - len(text) * 7) // 2  # Approximate width
                 y_pos = height // 2
                 graphics.DrawText(canvas, self.font, x_pos, y_pos,
-                                 graphics.Color(255, 255, 255), text)
\ No newline at end of file
+                                 self._gray[255], text)
\ No newline at end of file
@@ -5,7 +5,16 @@ from PIL import Image, ImageDraw
 from rgbmatrix import graphics
 
 from .base_plugin import DisplayPlugin
-from api_service import WeatherService
+from ._fonts import load_font
+from ._services import get_weather_service
+from ui.text import load_glyph_images, paste_glyph_text
+
+# BDF fonts used for self.font and self.font_small
+FONT_PATH = "resources/fonts/7x13.bdf"
+SMALL_FONT_PATH = "resources/fonts/4x6.bdf"
+
+# Page shown after each page (3 pages total)
+_NEXT_PAGE = (1, 2, 0)
 
 class WeatherPlugin(DisplayPlugin):
     """Plugin for displaying detailed weather information
@@ -20,6 +29,7 @@ class WeatherPlugin(DisplayPlugin):
         super().__init__(matrix, config)
         self.name = "weather"
         self.description = "Detailed weather display"
+        self.draws_full_frame = True  # blits full-frame images or clears
 
         # Default configuration
         self.config.setdefault('city_id', 4791160)
@@ -30,6 +40,10 @@ class WeatherPlugin(DisplayPlugin):
         self.last_update = 0
         self.weather_data = None
         self.weather_image = None
+        self._icon_cache = {}  # icon code -> resized icon image
+        self._cached_strings = {}  # display text, rebuilt with the data
+        self._page_images = None  # pre-rendered pages, rebuilt with the data
+        self._shown_image = None  # page image last pushed to the matrix
         self.current_page = 0
         self.page_time = 0
         self.page_duration = 5  # Seconds per page
@@ -56,16 +70,14 @@ class WeatherPlugin(DisplayPlugin):
         """Set up the weather plugin"""
         # Load fonts
         try:
-            self.font_small.LoadFont("resources/fonts/4x6.bdf")
-            self.font.LoadFont("resources/fonts/7x13.bdf") 
+            self.font_small = load_font(SMALL_FONT_PATH)
+            self.font = load_font(FONT_PATH)
         except Exception as e:
             print(f"Error loading fonts: {e}")
 
-        # Initialize service if not already
+        # Use the shared service if one wasn't provided
         if self.weather_service is None:
-            from api_service import APIService
-            api_service = APIService(None)  # We'll need to pass config
-            self.weather_service = WeatherService(api_service)
+            self.weather_service = get_weather_service()
 
         # Initial data fetch
         self._update_weather()
@@ -92,14 +104,86 @@ class WeatherPlugin(DisplayPlugin):
                     'clouds': data.get('clouds', {}).get('all', 0),
                     'icon': data['weather'][0]['icon']
                 }
-
-                # Load weather icon
-                from ui.image import load_image
-                icon_path = f"resources/images/weather-icons/{self.weather_data['icon']}.png"
-                self.weather_image = load_image(icon_path, (24, 24))
+                self._cached_strings = self._format_strings(self.weather_data)
+
+                # Load weather icon, decoding each icon file only once
+                # (failed loads aren't cached, so they're retried next update)
+                icon = self.weather_data['icon']
+                self.weather_image = self._icon_cache.get(icon)
+                if self.weather_image is None:
+                    from ui.image import load_image
+                    icon_path = f"resources/images/weather-icons/{icon}.png"
+                    self.weather_image = load_image(icon_path, (24, 24))
+                    if self.weather_image is not None:
+                        self._icon_cache[icon] = self.weather_image
+
+            # Redraw the pages for the new data (or the error screen)
+            if data or self._page_images is None:
+                self._build_pages()
 
             self.last_update = 0
 
+    def _format_strings(self, weather):
+        """Format the text shown on the weather pages
+
+        Args:
+            weather: Weather data dict built by _update_weather
+
+        Returns:
+            Dict of display strings keyed by what they show
+        """
+        wind_units = 'mph' if self.config['units'] == 'imperial' else 'm/s'
+        return {
+            'temp': f"{weather['temp']}°",
+            'desc': weather['description'].capitalize(),
+            'hilo': f"Hi: {weather['temp_max']}° Lo: {weather['temp_min']}°",
+            'humidity': f"Humidity: {weather['humidity']}%",
+            'wind': f"{weather['wind_speed']} {wind_units}",
+            'pressure': f"Press: {weather['pressure']} hPa"
+        }
+
+    def _draw_text(self, image, font_path, color, x, y, text):
+        """Draw text into a page image at a baseline position, like DrawText"""
+        paste_glyph_text(image, load_glyph_images(font_path, color, text), x, y, text)
+
+    def _build_pages(self):
+        """Pre-render every weather page so render() only has to blit one"""
+        size = (self.matrix.width, self.matrix.height)
+
+        if not self.weather_data:
+            # Display error message on every page
+            image = Image.new('RGB', size, (0, 0, 0))
+            self._draw_text(image, FONT_PATH, (255, 0, 0), 5, 16, "Weather")
+            self._draw_text(image, FONT_PATH, (255, 0, 0), 5, 30, "API Error")
+            self._page_images = [image] * 3
+            return
+
+        strings = self._cached_strings
+        pages = [Image.new('RGB', size, (0, 0, 0)) for _ in range(3)]
+
+        # Page 1: City, temperature, and icon
+        self._draw_text(pages[0], FONT_PATH, (255, 255, 255), 2, 12, self.weather_data['city'])
+        self._draw_text(pages[0], FONT_PATH, (0, 191, 255), 2, 30, strings['temp'])
+        if self.weather_image:
+            pages[0].paste(self.weather_image, (40, 14))
+
+        # Page 2: Description, hi/low
+        desc = strings['desc']
+        if len(desc) <= 10:
+            self._draw_text(pages[1], FONT_PATH, (255, 255, 255), 2, 12, desc)
+        else:
+            # Long descriptions use the small font
+            self._draw_text(pages[1], SMALL_FONT_PATH, (255, 255, 255), 2, 8, desc)
+        self._draw_text(pages[1], SMALL_FONT_PATH, (255, 114, 118), 2, 25, strings['hilo'])
+        self._draw_text(pages[1], SMALL_FONT_PATH, (173, 216, 230), 2, 32, strings['humidity'])
+
+        # Page 3: Wind and pressure
+        self._draw_text(pages[2], SMALL_FONT_PATH, (255, 255, 0), 2, 8, "Wind:")
+        self._draw_text(pages[2], FONT_PATH, (255, 255, 255), 2, 18, strings['wind'])
+        self._draw_text(pages[2], SMALL_FONT_PATH, (173, 255, 47), 2, 30, strings['pressure'])
+
+        self._page_images = pages
+
     def update(self, delta_time):
         """Update weather display state"""
         # Update timers
@@ -113,63 +197,20 @@ class WeatherPlugin(DisplayPlugin):
         # Cycle through pages
         if self.page_time >= self.page_duration:
             self.page_time = 0
-            self.current_page = (self.current_page + 1) % 3  # 3 pages total
+            self.current_page = _NEXT_PAGE[self.current_page]
+
+    def needs_render(self):
+        """Only redraw when the page or its data changed"""
+        if self._page_images is None:
+            return True
+        return self._page_images[self.current_page] is not self._shown_image
 
     def render(self, canvas):
         """Render the weather display"""
-        # Clear canvas
-        canvas.Clear()
-
-        if not self.weather_data:
-            # Display error message
-            graphics.DrawText(canvas, self.font, 5, 16, 
-                              self.colors['error'], "Weather")
-            graphics.DrawText(canvas, self.font, 5, 30, 
-                              self.colors['error'], "API Error")
-            return
+        if self._page_images is None:
+            self._build_pages()
 
-        # Show different pages of weather info
-        if self.current_page == 0:
-            # Page 1: City, temperature, and icon
-            graphics.DrawText(canvas, self.font, 2, 12, 
-                              self.colors['white'], self.weather_data['city'])
-
-            temp = f"{self.weather_data['temp']}°"
-            graphics.DrawText(canvas, self.font, 2, 30, 
-                              self.colors['skyBlue'], temp)
-
-            if self.weather_image:
-                canvas.SetImage(self.weather_image, 40, 14)
-
-        elif self.current_page == 1:
-            # Page 2: Description, hi/low
-            desc = self.weather_data['description'].capitalize()
-            desc_len = len(desc)
-
-            if desc_len <= 10:
-                graphics.DrawText(canvas, self.font, 2, 12, 
-                                 self.colors['white'], desc)
-            else:
-                # Split long description
-                graphics.DrawText(canvas, self.font_small, 2, 8, 
-                                 self.colors['white'], desc)
-
-            hi_lo = f"Hi: {self.weather_data['temp_max']}° Lo: {self.weather_data['temp_min']}°"
-            graphics.DrawText(canvas, self.font_small, 2, 25, 
-                             self.colors['pink'], hi_lo)
-
-            graphics.DrawText(canvas, self.font_small, 2, 32, 
-                             self.colors['lightBlue'], f"Humidity: {self.weather_data['humidity']}%")
-
-        elif self.current_page == 2:
-            # Page 3: Wind and pressure
-            graphics.DrawText(canvas, self.font_small, 2, 8, 
-                             self.colors['yellow'], "Wind:")
-
-            wind = f"{self.weather_data['wind_speed']} {self.config['units'] == 'imperial' and 'mph' or 'm/s'}"
-            graphics.DrawText(canvas, self.font, 2, 18, 
-                             self.colors['white'], wind)
-
-            pressure = f"Press: {self.weather_data['pressure']} hPa"
-            graphics.DrawText(canvas, self.font_small, 2, 30, 
-                             self.colors['lime'], pressure)
\ No newline at end of file
+        # Each page covers the whole canvas
+        image = self._page_images[self.current_page]
+        canvas.SetImage(image, 0, 0)
+        self._shown_image = image
@@ -1,14 +1,33 @@
 #!/usr/bin/env python
 import time
+import heapq
+import operator
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
+import threading
+from typing import NamedTuple
 from PIL import Image, ImageDraw, ImageFont
 import os
 from .base_plugin import DisplayPlugin
+from api_service import json_loads
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+class TrainInfo(NamedTuple):
+    """A processed train prediction"""
+    line: str  # Line code, e.g. 'OR'
+    minutes: int  # Minutes until arrival, 0 when arriving or boarding
+    min_display: str  # Arrival text, e.g. '5m' or 'BRD'
+    cars: str  # Number of cars
+
+# Radius of the line circle, and its filled shape as a paste mask
+CIRCLE_RADIUS = 7
+_CIRCLE_MASK = Image.new('L', (2 * CIRCLE_RADIUS + 1, 2 * CIRCLE_RADIUS + 1), 0)
+ImageDraw.Draw(_CIRCLE_MASK).ellipse([(0, 0), (2 * CIRCLE_RADIUS, 2 * CIRCLE_RADIUS)], fill=255)
+
 class WmataPlugin(DisplayPlugin):
     """Plugin for displaying WMATA (DC Metro) train arrival times
 
@@ -27,6 +46,15 @@ class WmataPlugin(DisplayPlugin):
         'YL': [255, 255, 0]     # Yellow
     }
 
+    # Arrival codes that aren't a minute count, as (minutes, display text)
+    ARRIVAL_CODES = {
+        'BRD': (0, "BRD"),  # Boarding
+        'ARR': (0, "ARR")   # Arriving
+    }
+
+    # Display text for arrivals under an hour away
+    MINUTE_TEXT = tuple(f"{minutes}m" for minutes in range(60))
+
     # Simplified station names and line mappings
     STATION_NAMES = {
         'A01': 'Metro Center', 'A02': 'Farragut North', 'A03': 'Dupont Circle',
@@ -89,21 +117,33 @@ class WmataPlugin(DisplayPlugin):
         super().__init__(matrix, config)
         self.name = "wmata"
         self.description = "DC Metro train arrival times"
+        self.draws_full_frame = True  # always blits a full-frame image
 
         # Default configuration
         self.config.setdefault('api_key', '')
         self.config.setdefault('stations', ['K04', 'C01'])  # Vienna and Metro Center
         self.config.setdefault('update_interval', 50)  # 50 seconds between API calls
+        self.config.setdefault('min_update_interval', 15)  # Interval when a train is 2 min or less away
+        self.config.setdefault('max_update_interval', 90)  # Interval when no train is under 10 min away
         self.config.setdefault('max_trains', 2)  # Show up to 2 trains per station
         self.config.setdefault('line_colors', self.LINE_COLORS.copy())
 
         # Internal state
         self.last_update = 0
+        self._update_interval = self.config['update_interval']  # adapted to the next arrival
         self.train_data = {}
         self.current_display = None
+        self._base_display = None  # display without the scrolling station text
+        self._frame_buffers = None  # two images scroll frames are drawn into in turn
+        self._text_buffer = None  # text area a scrolling half is composed in
+        self._scrolling_halves = ()  # (y offset, station code, text layers) of each scrolling station
+        self._name_strips = {}  # station name -> (pre-rendered name strip, text x)
+        self._name_widths = {}  # station name -> measured pixel width
+        self._status_image = None  # key missing / loading message
+        self._shown_image = None  # image last pushed to the matrix
         self.scroll_position = 0
-        self.scroll_timer = 0
-        self.scroll_speed = 0.06  # Seconds between scroll updates
+        self.scroll_speed = 1 / 0.06  # Pixels per second
+        self._scroll_fraction = 0.0  # part of a pixel scrolled but not yet drawn
 
         # Text width and scrolling data
         self.station_name_width = {}
@@ -113,15 +153,47 @@ class WmataPlugin(DisplayPlugin):
         # Single PIL font for all text rendering
         self.pil_font = None
 
+        # Configured line colors as fill tuples, and each configured station's
+        # (line code, circle color), built in setup()
+        self._line_rgb = {}
+        self._station_render = {}
+
+        # The two stations shown, resolved again in setup() once validated
+        self._stations = tuple(self.config['stations'][:2])
+
         # API response cache
         self.api_cache = {}
-        self.api_cache_time = {}
+        self.api_cache_time = {}  # station code -> time.monotonic() of the cached response
+        self._etag = {}  # requested station codes -> ETag of the cached response
+        self._last_modified = {}  # requested station codes -> Last-Modified of the cached response
+
+        # Background fetching; the fetch thread hands its results to update()
+        # through _fetch_results, guarded by _lock
+        self._fetch_thread = None
+        self._fetch_results = None
+        self._lock = threading.Lock()
+
+        # Keep-alive HTTP session for the prediction requests, with quick
+        # retries of transient errors
+        self._session = requests.Session()
+        self._session.mount('https://', HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=1,
+            max_retries=Retry(total=2, backoff_factor=0.3,
+                              status_forcelist=[429, 502, 503, 504],
+                              raise_on_status=False)
+        ))
 
     def setup(self):
         """Set up the WMATA plugin"""
         # Check configuration and validate stations
         logger.info(f"WMATA plugin configuration: {self.config}")
         self._validate_stations()
+        self._stations = tuple(self.config['stations'][:2])
+
+        # Convert the configured line colors once instead of on every draw
+        self._line_rgb = {line: tuple(rgb) for line, rgb in self.config.get('line_colors', {}).items()}
+        self._station_render = {code: self._station_line(code) for code in self._stations}
 
         # Load PIL font for drawing text
         try:
@@ -141,7 +213,7 @@ class WmataPlugin(DisplayPlugin):
             self.pil_font = ImageFont.load_default()
 
         # Initial data fetch
-        self._fetch_train_data()
+        self._start_fetch()
 
     def _validate_stations(self):
         """Validate and normalize station configuration"""
@@ -151,46 +223,164 @@ class WmataPlugin(DisplayPlugin):
         while len(self.config['stations']) < 2:
             self.config['stations'].append('C01')  # Default to Metro Center
 
-    def _fetch_train_data(self):
-        """Fetch train arrival predictions from WMATA API"""
+    def _start_fetch(self, use_cache=True):
+        """Fetch train data on a background thread unless a fetch is running
+
+        Args:
+            use_cache: Passed on to _fetch_train_data()
+        """
+        if self._fetch_thread and self._fetch_thread.is_alive():
+            return
+
+        self._fetch_thread = threading.Thread(target=self._fetch_train_data, args=(use_cache,))
+        self._fetch_thread.daemon = True  # Don't hold up shutdown on a slow request
+        self._fetch_thread.start()
+
+    def _fetch_train_data(self, use_cache=True):
+        """Fetch train arrival predictions from WMATA API
+
+        Runs on the background fetch thread. The responses are handed to
+        update(), which applies them with _apply_train_data() so the display
+        state is only ever changed on the display thread.
+
+        Args:
+            use_cache: Skip stations whose cached response is younger than
+                the update interval. The update timer turns this off, as its
+                interval has already elapsed and the cache times, stamped on
+                this thread, can lag it slightly
+        """
         api_key = self.config.get('api_key', '')
         if not api_key:
             logger.error("No API key configured for WMATA data")
             return
 
-        # Get station codes to fetch (exactly 2)
-        stations = self.config.get('stations', [])[:2]
-        current_time = time.time()
+        # Station codes to fetch (exactly 2)
+        stations = self._stations
+        # Monotonic, so the Pi's clock being set at boot can't skew cache ages
+        current_time = time.monotonic()
 
-        for station_code in stations:
-            # Check cache first
-            if (station_code in self.api_cache and
-                current_time - self.api_cache_time.get(station_code, 0) < self.config['update_interval']):
-                continue
+        # Check cache first, requesting a station shown in both halves only once
+        due = [station_code for station_code in dict.fromkeys(stations)
+               if not (use_cache and station_code in self.api_cache and
+                       current_time - self.api_cache_time.get(station_code, 0) < self._update_interval)]
 
-            # WMATA API endpoint
-            url = f"https://api.wmata.com/StationPrediction.svc/json/GetPrediction/{station_code}"
-            headers = {'api_key': api_key}
+        # Request all the due stations at once
+        results = self._fetch_stations(due, api_key) if due else []
 
-            try:
-                response = requests.get(url, headers=headers, timeout=10)
-                if response.status_code != 200:
-                    self.train_data[station_code] = {"error": f"HTTP {response.status_code}"}
-                    continue
+        with self._lock:
+            self._fetch_results = (current_time, due, results)
 
-                # Process response
-                data = response.json()
-                self.api_cache[station_code] = data
+    def _apply_train_data(self):
+        """Apply the results of a finished background fetch, if there are any"""
+        with self._lock:
+            fetch_results, self._fetch_results = self._fetch_results, None
+        if fetch_results is None:
+            return
+
+        current_time, due, results = fetch_results
+        changed = False
+        for station_code, (data, error) in zip(due, results):
+            previous = self.train_data.get(station_code)
+
+            if error:
+                self.train_data[station_code] = {"error": error}
+            else:
                 self.api_cache_time[station_code] = current_time
+                if data is None:
+                    # Not modified, keep the processed trains unless an
+                    # earlier failed fetch replaced them with its error
+                    if "error" not in self.train_data.get(station_code, {}):
+                        continue
+                    data = self.api_cache[station_code]
+                else:
+                    self.api_cache[station_code] = data
+
+                # Process response
                 self._process_station_data(station_code, data)
 
-            except Exception as e:
-                logger.error(f"Error fetching data for station {station_code}: {e}")
-                self.train_data[station_code] = {"error": str(e)}
+            # Polls often return the same arrivals, those don't need a redraw
+            if self.train_data[station_code] != previous:
+                changed = True
 
         # Calculate text widths and prepare for scrolling
-        self._prepare_display()
-        self.last_update = 0
+        if changed or self.current_display is None:
+            self._prepare_display()
+        self._adapt_update_interval()
+
+    def _adapt_update_interval(self):
+        """Poll more often while a train is close and less often when none is"""
+        soonest = min((train.minutes for station_data in self.train_data.values()
+                       for train in station_data.get('trains', [])), default=None)
+
+        interval = self.config['update_interval']
+        if soonest is not None:
+            if soonest <= 2:
+                interval = min(interval, self.config['min_update_interval'])
+            elif soonest >= 10:
+                interval = max(interval, self.config['max_update_interval'])
+        self._update_interval = interval
+
+    def _fetch_stations(self, station_codes, api_key):
+        """Fetch the prediction data for several stations in one request
+
+        The GetPrediction endpoint takes a comma-separated list of station
+        codes and tags each train with the LocationCode it arrives at, so
+        the trains are split back up by station here.
+
+        Runs on the fetch thread, so it only touches the request validators
+        in the plugin state.
+
+        Args:
+            station_codes: List of WMATA station codes
+            api_key: WMATA API key
+
+        Returns:
+            List of (data, error) tuples in station_codes order; data is None
+            if the request failed, and both are None if the predictions
+            haven't changed since the cached responses
+        """
+        # WMATA API endpoint
+        request_key = ','.join(station_codes)
+        url = f"https://api.wmata.com/StationPrediction.svc/json/GetPrediction/{request_key}"
+        headers = {'api_key': api_key}
+
+        # Let the API answer 304 when the cached predictions are still current
+        cached = all(station_code in self.api_cache for station_code in station_codes)
+        if cached:
+            if request_key in self._etag:
+                headers['If-None-Match'] = self._etag[request_key]
+            if request_key in self._last_modified:
+                headers['If-Modified-Since'] = self._last_modified[request_key]
+
+        try:
+            response = self._session.get(url, headers=headers, timeout=10)
+            if response.status_code == 304 and cached:
+                return [(None, None)] * len(station_codes)
+            if response.status_code != 200:
+                return [(None, f"HTTP {response.status_code}")] * len(station_codes)
+
+            data = json_loads(response.content)
+
+            # Remember the validators for the next request
+            self._etag.pop(request_key, None)
+            self._last_modified.pop(request_key, None)
+            if response.headers.get('ETag'):
+                self._etag[request_key] = response.headers['ETag']
+            if response.headers.get('Last-Modified'):
+                self._last_modified[request_key] = response.headers['Last-Modified']
+
+            # Split the trains up by station
+            station_trains = {station_code: [] for station_code in station_codes}
+            for train in data.get('Trains', []):
+                trains = station_trains.get(train.get('LocationCode'))
+                if trains is not None:
+                    trains.append(train)
+
+        except Exception as e:
+            logger.error(f"Error fetching data for stations {request_key}: {e}")
+            return [(None, str(e))] * len(station_codes)
+
+        return [({'Trains': station_trains[station_code]}, None) for station_code in station_codes]
 
     def _process_station_data(self, station_code, data):
         """Process raw API data for a station"""
@@ -206,33 +396,27 @@ class WmataPlugin(DisplayPlugin):
         processed_trains = []
         for train in trains:
             # Process minutes display
-            min_val = train.get('Min', '')
-            if min_val == 'BRD':
-                minutes = 0
-                min_display = "BRD"
-            elif min_val == 'ARR':
-                minutes = 0
-                min_display = "ARR"
-            elif min_val.isdigit():
-                minutes = int(min_val)
-                min_display = f"{minutes}m"
-            else:
-                continue  # Skip trains with no arrival information
-
-            processed_trains.append({
-                'line': train.get('Line', ''),
-                'minutes': minutes,
-                'min_display': min_display,
-                'cars': train.get('Car', '')
-            })
-
-        # Sort by minutes and limit to max_trains
-        processed_trains.sort(key=lambda x: x['minutes'])
+            min_val = train.get('Min')
+            arrival = self.ARRIVAL_CODES.get(min_val)
+            if arrival is None:
+                try:
+                    minutes = int(min_val)
+                except (TypeError, ValueError):
+                    continue  # Skip trains with no arrival information ('---', '')
+                arrival = (minutes, self.MINUTE_TEXT[minutes] if 0 <= minutes < 60 else f"{minutes}m")
+            minutes, min_display = arrival
+
+            processed_trains.append(TrainInfo(train.get('Line', ''), minutes, min_display, train.get('Car', '')))
+
+        # Keep the max_trains soonest trains, in arrival order
         max_trains = self.config.get('max_trains', 2)
+        trains = heapq.nsmallest(max_trains, processed_trains, key=operator.attrgetter('minutes'))
 
         self.train_data[station_code] = {
             "name": self.STATION_NAMES.get(station_code, station_code),
-            "trains": processed_trains[:max_trains]
+            "trains": trains,
+            # Formatted once here rather than on every scroll frame
+            "arrivals": " - ".join(train.min_display for train in trains)
         }
 
     def _prepare_display(self):
@@ -246,23 +430,15 @@ class WmataPlugin(DisplayPlugin):
         left_width = 16  # 16px for line circle
         available_width = self.matrix.width - left_width
 
-        # Create a dummy image to measure text width
-        dummy = Image.new('RGB', (1, 1))
-        draw = ImageDraw.Draw(dummy)
-
-        for station_code in self.config.get('stations', [])[:2]:
+        for station_code in self._stations:
             # Get station name
             station_data = self.train_data.get(station_code, {})
             station_name = station_data.get("name", self.STATION_NAMES.get(station_code, station_code))
 
-            # Measure text width with the current font
-            try:
-                # For newer PIL versions
-                bbox = draw.textbbox((0, 0), station_name, font=self.pil_font)
-                name_width = bbox[2] - bbox[0]
-            except (AttributeError, TypeError):
-                # For older PIL versions
-                name_width = draw.textsize(station_name, font=self.pil_font)[0]
+            # Station names don't change between polls, so each is measured once
+            name_width = self._name_widths.get(station_name)
+            if name_width is None:
+                name_width = self._name_widths[station_name] = self._measure_text(station_name)
 
             self.station_name_width[station_code] = name_width
             self.should_scroll[station_code] = name_width > available_width
@@ -270,8 +446,25 @@ class WmataPlugin(DisplayPlugin):
             # Calculate total scroll amount if needed
             self.scroll_amount[station_code] = name_width + 40 if self.should_scroll[station_code] else 0
 
+    def _measure_text(self, text):
+        """Measure the pixel width of text in the current font"""
+        # Create a dummy image to measure text width
+        draw = ImageDraw.Draw(Image.new('RGB', (1, 1)))
+        try:
+            # For newer PIL versions
+            bbox = draw.textbbox((0, 0), text, font=self.pil_font)
+            return bbox[2] - bbox[0]
+        except (AttributeError, TypeError):
+            # For older PIL versions
+            return draw.textsize(text, font=self.pil_font)[0]
+
     def _create_split_screen_display(self):
-        """Create a display with split screen for two stations"""
+        """Create a display with split screen for two stations
+
+        Everything except the text of scrolling stations is drawn once into
+        a base image here, along with pre-rendered layers for that text;
+        _draw_scroll_frame() only pastes the layers on each scroll step.
+        """
         # Create a new image for the display
         width = self.matrix.width
         height = self.matrix.height
@@ -280,93 +473,185 @@ class WmataPlugin(DisplayPlugin):
 
         # Draw each station in its half
         half_height = height // 2
-        stations = self.config.get('stations', [])[:2]
+        stations = self._stations
 
+        scrolling_halves = []
         for i, station_code in enumerate(stations):
             y_offset = i * half_height
             self._draw_station_half(draw, display_image, width, half_height, y_offset, station_code)
+            if self.should_scroll.get(station_code, False):
+                scrolling_halves.append((y_offset, station_code) +
+                                        self._create_scroll_layers(station_code, width, half_height))
+            else:
+                self._draw_station_text(display_image, width, half_height, y_offset, station_code)
+
+        self._draw_separator(display_image, width, half_height)
+        self._scrolling_halves = tuple(scrolling_halves)
+
+        # Store the display, then add the scrolling text
+        self._base_display = display_image
+        self._draw_scroll_frame()
+
+    def _draw_scroll_frame(self):
+        """Draw the scrolling station text at the current scroll position"""
+        if not self._scrolling_halves:
+            self.current_display = self._base_display
+            return
+
+        width = self.matrix.width
+        half_height = self.matrix.height // 2
+        left_width = 16
 
-        # Draw separator line
-        for x in range(width):
-            display_image.putpixel((x, half_height), (20, 20, 20))
+        # Draw into the frame buffer that isn't on the matrix, so scroll
+        # steps reuse two images instead of allocating one each. Going by
+        # what was last shown rather than current_display means a second
+        # draw before the next render still differs from the shown image.
+        if self._frame_buffers is None:
+            self._frame_buffers = (Image.new('RGB', self._base_display.size),
+                                   Image.new('RGB', self._base_display.size))
+            self._text_buffer = Image.new('RGB', (width - left_width, half_height))
+        display_image = self._frame_buffers[self._shown_image is self._frame_buffers[0]]
+        display_image.paste(self._base_display)
+
+        # Each half's text is composed in the text-area buffer, where a paste
+        # at a negative x clips the name instead of cropping a copy of it
+        text_buffer = self._text_buffer
+        for y_offset, station_code, name_strip, text_x, times_mask, times_color in self._scrolling_halves:
+            text_buffer.paste((0, 0, 0), (0, 0) + text_buffer.size)
+            scroll_x = self._name_scroll_x(station_code, width - left_width)
+            if scroll_x < width - left_width:
+                text_buffer.paste(name_strip, (scroll_x - text_x, 0))
+
+            # Arrival times go over the name, as when drawn in that order
+            text_buffer.paste(times_color, (0, 0), times_mask)
+            display_image.paste(text_buffer, (left_width, y_offset))
+
+        # The bottom station's text covers the separator row
+        self._draw_separator(display_image, width, half_height)
 
-        # Store the display
         self.current_display = display_image
 
-    def _draw_station_half(self, draw, display_image, width, half_height, y_offset, station_code):
-        """Draw a single station info in its half of the screen"""
-        # Get station data
-        station_data = self.train_data.get(station_code, {})
-        station_name = station_data.get("name", self.STATION_NAMES.get(station_code, station_code))
-        trains = station_data.get("trains", [])
+    def _draw_separator(self, display_image, width, half_height):
+        """Draw the separator line between the two stations"""
+        display_image.paste((20, 20, 20), (0, half_height, width, half_height + 1))
 
+    def _draw_station_half(self, draw, display_image, width, half_height, y_offset, station_code):
+        """Draw the line circle of a station in its half of the screen"""
         # Left section width for line circle
         left_width = 16
 
         # Determine line color
-        primary_line = self.STATION_LINES.get(station_code, "RD")
-        line_color = tuple(self.config.get('line_colors', {}).get(primary_line, [255, 255, 255]))
+        primary_line, line_color = self._station_render.get(station_code) or self._station_line(station_code)
 
         # Draw colored circle with line code
         circle_x, circle_y = left_width // 2, y_offset + half_height // 2
-        circle_radius = 7
-        draw.ellipse(
-            [(circle_x - circle_radius, circle_y - circle_radius),
-             (circle_x + circle_radius, circle_y + circle_radius)],
-            fill=line_color
-        )
+        display_image.paste(line_color, (circle_x - CIRCLE_RADIUS, circle_y - CIRCLE_RADIUS), _CIRCLE_MASK)
 
         # Draw line code inside circle
         draw.text((circle_x - 4, circle_y - 3), primary_line, fill=(0, 0, 0))
 
+    def _station_line(self, station_code):
+        """Get the line code shown for a station and its circle color"""
+        primary_line = self.STATION_LINES.get(station_code, "RD")
+        return primary_line, self._line_rgb.get(primary_line, (255, 255, 255))
+
+    def _draw_station_text(self, display_image, width, half_height, y_offset, station_code):
+        """Draw the static station name and arrival times in a station's half of the screen"""
+        # Get station data
+        station_data = self.train_data.get(station_code, {})
+        station_name = station_data.get("name", self.STATION_NAMES.get(station_code, station_code))
+
+        # Left section width for line circle
+        left_width = 16
+
         # Create the text section image
         text_image = Image.new('RGB', (width - left_width, half_height), (0, 0, 0))
         text_draw = ImageDraw.Draw(text_image)
 
-        # Draw station name (static or scrolling)
-        self._draw_station_name(text_draw, station_code, station_name, width, left_width)
+        # Draw station name
+        text_draw.text((2, 0), station_name, font=self.pil_font, fill=(255, 255, 255))
 
         # Draw train arrival times
-        self._draw_train_times(text_draw, station_data, trains)
+        text, color = self._train_times_text(station_data)
+        text_draw.text((2, 8), text, font=self.pil_font, fill=color)
+
+        # Paste the text image; it is exactly the text area, so the text is
+        # clipped to this station's half without needing a mask
+        display_image.paste(text_image, (left_width, y_offset))
+
+    def _create_scroll_layers(self, station_code, width, half_height):
+        """Pre-render the text of a scrolling station
+
+        Args:
+            station_code: WMATA station code
+            width: Display width
+            half_height: Height of a station's half of the display
+
+        Returns:
+            Tuple of (name strip, x of the name in the strip, arrival times
+            mask, arrival times color); the strip is the name in white on
+            black, and the mask covers the station's text area
+        """
+        station_data = self.train_data.get(station_code, {})
+        station_name = station_data.get("name", self.STATION_NAMES.get(station_code, station_code))
+        left_width = 16
 
-        # Create mask and paste the text image
-        mask = Image.new('1', (width, half_height), 0)
-        mask_draw = ImageDraw.Draw(mask)
-        mask_draw.rectangle([(left_width, 0), (width, half_height)], fill=1)
+        # Station names don't change between polls, so their strips are kept
+        if station_name not in self._name_strips:
+            self._name_strips[station_name] = self._create_name_strip(station_name, half_height)
+        name_strip, text_x = self._name_strips[station_name]
 
-        display_image.paste(text_image, (left_width, y_offset), mask.crop((left_width, 0, width, half_height)))
+        text, color = self._train_times_text(station_data)
+        times_mask = Image.new('L', (width - left_width, half_height), 0)
+        ImageDraw.Draw(times_mask).text((2, 8), text, font=self.pil_font, fill=255)
 
-    def _draw_station_name(self, text_draw, station_code, station_name, width, left_width):
-        """Draw the station name (either static or scrolling)"""
-        if not self.should_scroll.get(station_code, False):
-            # Static display
-            text_draw.text((2, 0), station_name, font=self.pil_font, fill=(255, 255, 255))
-        else:
-            # Scrolling display
-            scroll_x = width - left_width - self.scroll_position
+        return name_strip, text_x, times_mask, color
 
-            # Reset when scrolled off screen
-            if scroll_x < -self.station_name_width[station_code] - 100:
-                scroll_x = width - left_width
+    def _create_name_strip(self, station_name, half_height):
+        """Render a station name in white on black
 
-            # Draw only when visible
-            if scroll_x < width - left_width:
-                text_draw.text((scroll_x, 0), station_name, font=self.pil_font, fill=(255, 255, 255))
+        Returns:
+            Tuple of (strip image, x of the name in the strip)
+        """
+        # Leave room for glyphs that start left of the text position
+        measure = ImageDraw.Draw(Image.new('RGB', (1, 1)))
+        try:
+            left, _, right, _ = measure.textbbox((0, 0), station_name, font=self.pil_font)
+        except (AttributeError, TypeError):
+            left, right = 0, measure.textsize(station_name, font=self.pil_font)[0]
+        text_x = max(0, -left)
+
+        name_strip = Image.new('RGB', (max(1, right + text_x), half_height), (0, 0, 0))
+        ImageDraw.Draw(name_strip).text((text_x, 0), station_name, font=self.pil_font, fill=(255, 255, 255))
+        return name_strip, text_x
+
+    def _name_scroll_x(self, station_code, text_width):
+        """Get the x position of a scrolling station name in its text area"""
+        scroll_x = text_width - self.scroll_position
+
+        # Reset when scrolled off screen
+        if scroll_x < -self.station_name_width[station_code] - 100:
+            scroll_x = text_width
+        return scroll_x
 
-    def _draw_train_times(self, text_draw, station_data, trains):
-        """Draw the train arrival times"""
+    def _train_times_text(self, station_data):
+        """Get the arrival times text of a station and the color to draw it in
+
+        Args:
+            station_data: Station entry from train_data
+
+        Returns:
+            Tuple of (text, RGB color)
+        """
+        trains = station_data.get("trains", [])
         if not trains:
             # No trains or error
             text = "API Error" if "error" in station_data else "No trains"
             color = (255, 0, 0) if "error" in station_data else (150, 150, 150)
-            text_draw.text((2, 8), text, font=self.pil_font, fill=color)
-            return
-
-        # Format arrival times
-        train_info = " - ".join(train.get('min_display', '') for train in trains)
+            return text, color
 
         # Determine color based on time
-        minutes = trains[0].get('minutes', 999)
+        minutes = trains[0].minutes
         if minutes == 0:
             info_color = (255, 165, 0)  # Orange for arriving/boarding
         elif minutes <= 5:
@@ -374,46 +659,50 @@ class WmataPlugin(DisplayPlugin):
         else:
             info_color = (255, 255, 255)  # White for longer times
 
-        # Draw train info
-        text_draw.text((2, 8), train_info, font=self.pil_font, fill=info_color)
+        # Arrival times, formatted when the data was processed
+        return station_data["arrivals"], info_color
 
     def update(self, delta_time):
         """Update WMATA display"""
+        # Show the data of a finished fetch
+        self._apply_train_data()
+
         # Update API data when interval elapsed
         self.last_update += delta_time
-        if self.last_update >= self.config['update_interval']:
-            self._fetch_train_data()
-            return
+        if self.last_update >= self._update_interval:
+            self.last_update = 0
+
+            # Fetch in the background so a slow API doesn't stall the display
+            self._start_fetch(use_cache=False)
 
         # Handle scrolling if needed
         if not any(self.should_scroll.values()):
             return
 
-        # Update scroll position
-        self.scroll_timer += delta_time
-        if self.scroll_timer >= self.scroll_speed:
-            self.scroll_timer = 0
-            self.scroll_position += 1
-
-            # Reset at the end of the longest scroll
+        # Advance by whole pixels, carrying the fraction over, so the scroll
+        # speed doesn't depend on the frame rate
+        advance = delta_time * self.scroll_speed + self._scroll_fraction
+        steps = int(advance)
+        self._scroll_fraction = advance - steps
+        if steps > 0:
+            # Wrap around at the end of the longest scroll
             max_scroll = max(self.scroll_amount.values(), default=0)
-            if self.scroll_position > max_scroll:
-                self.scroll_position = 0
+            self.scroll_position = (self.scroll_position + steps) % (max_scroll + 1)
 
             # Update display with new scroll position
-            self._create_split_screen_display()
+            self._draw_scroll_frame()
 
-    def render(self, canvas):
-        """Render the WMATA display"""
-        # Clear canvas
-        canvas.Clear()
+    def _frame_image(self):
+        """Get the image to show, the status message until train data is drawn"""
+        if self.current_display is not None:
+            return self.current_display
 
-        # Check if we have a display image
-        if self.current_display:
-            canvas.SetImage(self.current_display)
-            return
+        if self._status_image is None:
+            self._status_image = self._create_status_image()
+        return self._status_image
 
-        # Show error/loading message if no display
+    def _create_status_image(self):
+        """Create the message shown when there is no train data to display"""
         error_image = Image.new('RGB', (self.matrix.width, self.matrix.height), (0, 0, 0))
         error_draw = ImageDraw.Draw(error_image)
 
@@ -426,13 +715,36 @@ class WmataPlugin(DisplayPlugin):
             error_draw.text((2, 8), "Loading", font=self.pil_font, fill=(255, 255, 255))
             error_draw.text((2, 16), "train data", font=self.pil_font, fill=(255, 255, 255))
 
-        canvas.SetImage(error_image)
+        return error_image
+
+    def needs_render(self):
+        """Only redraw when the display image changed"""
+        return self._frame_image() is not self._shown_image
+
+    def render(self, canvas):
+        """Render the WMATA display"""
+        # The image covers the whole canvas, so this also clears it
+        image = self._frame_image()
+        canvas.SetImage(image)
+        self._shown_image = image
 
     def cleanup(self):
         """Clean up resources"""
         # Clear all cached data
         self.api_cache.clear()
         self.api_cache_time.clear()
+        self._etag.clear()
+        self._last_modified.clear()
         self.train_data.clear()
         self.current_display = None
+        self._base_display = None
+        self._scrolling_halves = ()
+        self._name_strips.clear()
+        self._name_widths.clear()
+        self._shown_image = None
+        with self._lock:
+            self._fetch_results = None
+
+        # Release idle keep-alive connections while the plugin is inactive
+        self._session.close()
         super().cleanup()
\ No newline at end of file
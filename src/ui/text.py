@@ -1,7 +1,115 @@
 #!/usr/bin/env python
+from functools import lru_cache
+from PIL import Image, BdfFontFile
 from rgbmatrix import graphics
 from .component import UIComponent
 
+# Glyph drawn for characters a font lacks, as graphics.DrawText does
+REPLACEMENT_CHARACTER = 0xFFFD
+
+@lru_cache(maxsize=None)
+def _parse_bdf(font_path):
+    """Parse a BDF font file once and return its glyphs by code point
+
+    BdfFontFile only keeps the first 256 code points, so the glyphs are
+    read with its bdf_char() to cover the whole font.
+    """
+    glyph_table = {}
+    with open(font_path, 'rb') as f:
+        while True:
+            char = BdfFontFile.bdf_char(f)
+            if not char:
+                break
+            _, code, metrics, bitmap = char
+            glyph_table[code] = metrics + (bitmap,)
+    return glyph_table
+
+def load_glyph_images(font_path, color, chars):
+    """Rasterize characters of a BDF font into RGB images
+
+    Args:
+        font_path: Path to the BDF font file
+        color: RGB color tuple for lit pixels
+        chars: Iterable of characters to rasterize
+
+    Returns:
+        Dict mapping each character to an (image, x_offset, y_offset, advance,
+        mask) tuple. Offsets are relative to the text baseline, as used by
+        graphics.DrawText. The mask is the glyph's 1-bit bitmap, so the glyph
+        can be pasted without covering what's under its unlit pixels. The
+        image and mask are None for blank glyphs. Characters the font lacks
+        get its replacement glyph, and are left out if it has none.
+    """
+    glyph_table = _parse_bdf(font_path)
+    glyphs = {}
+
+    for char in set(chars):
+        glyph = glyph_table.get(ord(char)) or glyph_table.get(REPLACEMENT_CHARACTER)
+        if not glyph:
+            continue
+
+        (advance, _), (x0, y0, _, _), _, bitmap = glyph
+        image = mask = None
+        if bitmap.getbbox():
+            image = Image.new('RGB', bitmap.size, (0, 0, 0))
+            image.paste(color, (0, 0), bitmap)
+            mask = bitmap
+
+        glyphs[char] = (image, x0, y0, advance, mask)
+
+    return glyphs
+
+def draw_glyph_text(canvas, glyphs, x, y, text):
+    """Draw text by blitting pre-rendered glyph images
+
+    Args:
+        canvas: RGB Matrix canvas to render to
+        glyphs: Dict returned by load_glyph_images
+        x: X position of the first character
+        y: Baseline Y position
+        text: Text to draw; every character must be present in glyphs
+
+    Returns:
+        Width of the drawn text in pixels
+    """
+    cursor_x = x
+    for char in text:
+        image, x_offset, y_offset, advance, _ = glyphs[char]
+        if image is not None:
+            canvas.SetImage(image, cursor_x + x_offset, y + y_offset)
+        cursor_x += advance
+
+    return cursor_x - x
+
+def paste_glyph_text(image, glyphs, x, y, text):
+    """Paste pre-rendered glyph images into a PIL image
+
+    Glyphs are pasted through their bitmaps, so like ImageDraw.text only
+    the lit pixels are drawn and the rest of the image shows through.
+
+    Args:
+        image: PIL Image to draw into
+        glyphs: Dict returned by load_glyph_images
+        x: X position of the first character
+        y: Baseline Y position
+        text: Text to draw; characters missing from glyphs are skipped
+
+    Returns:
+        Width of the drawn text in pixels
+    """
+    cursor_x = x
+    for char in text:
+        glyph = glyphs.get(char)
+        if glyph is None:
+            continue
+
+        glyph_image, x_offset, y_offset, advance, mask = glyph
+        if glyph_image is not None:
+            image.paste(glyph_image, (cursor_x + x_offset, y + y_offset), mask)
+        cursor_x += advance
+
+    return cursor_x - x
+
 class TextComponent(UIComponent):
     """Component for displaying text
 